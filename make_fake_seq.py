@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import os
 from pathlib import Path
 
 
@@ -23,7 +24,7 @@ def infer_from_sample(sample: str):
 
 
 def build_filename(base: str, frame: int, pad: int, ext: str):
-    return f"{base}.{str(frame).zfill(pad)}.{ext}"
+    return f"{base}.{frame:0{pad}d}.{ext}"
 
 
 def make_sequence(
@@ -39,19 +40,24 @@ def make_sequence(
 ):
     out_dir.mkdir(parents=True, exist_ok=True)
     created, skipped = 0, 0
+    # Same output as build_filename, but the width spec is parsed once
+    fmt = f"{{}}.{{:0{pad}d}}.{{}}"
+    out_dir_str = os.fspath(out_dir)
     for f in range(start, end + 1, step):
-        fname = build_filename(base, f, pad, ext)
-        path = out_dir / fname
+        path = os.path.join(out_dir_str, fmt.format(base, f, ext))
         if dry_run:
             print("[DRY] ", path)
             continue
-        if path.exists():
+        # Create a 0-byte file; O_EXCL makes the existence check part of the
+        # open, so there's no separate exists() round-trip.
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
             if touch_existing:
-                path.touch()  # update mtime
+                os.utime(path, None)  # update mtime
             skipped += 1
             continue
-        # Create a 0-byte file
-        path.touch()
+        os.close(fd)
         created += 1
     return created, skipped
 
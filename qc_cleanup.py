@@ -21,6 +21,7 @@ Usage examples:
 """
 
 import os
+import shutil
 from pathlib import Path
 import argparse
 
@@ -34,64 +35,84 @@ HASHCACHE_NAME = hashcache.get_hashcache_name()  # e.g. ".qc.hashcache.json"
 # Dot-variant of the sequence name, used in --sidecar-mode dot, e.g. ".qc.sequence.json"
 SEQ_DOT_NAME = SEQ_NAME if SEQ_NAME.startswith(".") else f".{SEQ_NAME}"
 
+# Exact filenames that are always QC artifacts
+TARGETS = frozenset({SEQ_NAME, SEQ_DOT_NAME, HASHCACHE_NAME})
+
+# Subdir-mode sidecar folder; removed wholesale
+QC_DIR_NAME = ".qc"
+
 
 def should_remove_file(name: str) -> bool:
     """
     Decide whether a file should be removed as a QC artifact.
-    """
-    # Inline sidecars (applies to inline mode + dot-prefixed inline files)
-    if name.endswith(SIDE_SUFFIX_FILE):
-        return True
 
-    # Sequence sidecars (inline/subdir + dot variants)
-    if name == SEQ_NAME or name == SEQ_DOT_NAME:
-        return True
-
-    # Hash cache
-    if name == HASHCACHE_NAME:
-        return True
-
-    return False
+    Sequence sidecars (inline/subdir + dot variants) and the hash cache match
+    by exact name; inline sidecars (incl. dot-prefixed) by suffix.
+    """
+    return name in TARGETS or name.endswith(SIDE_SUFFIX_FILE)
+
+
+def _remove_file(file_path: Path, dry_run: bool) -> int:
+    if dry_run:
+        print(f"[DRY-RUN] Would remove: {file_path}")
+        return 0
+    try:
+        file_path.unlink()
+        print(f"Removed: {file_path}")
+        return 1
+    except Exception as e:
+        print(f"Failed to remove {file_path}: {e}")
+        return 0
+
+
+def _remove_qc_dir(qc_dir: Path, dry_run: bool) -> int:
+    if dry_run:
+        print(f"[DRY-RUN] Would remove directory: {qc_dir}")
+        return 0
+    try:
+        shutil.rmtree(qc_dir)
+        print(f"Removed directory: {qc_dir}")
+        return 1
+    except Exception as e:
+        print(f"Failed to remove {qc_dir}: {e}")
+        return 0
 
 
 def cleanup(root: Path, dry_run: bool = False) -> int:
-    removed = 0
-
-    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
-        p = Path(dirpath)
+    """
+    Remove QC artifacts under root and return how many items were removed.
 
-        # 1. Remove known sidecar / cache files
-        for f in filenames:
-            file_path = p / f
-            if should_remove_file(f):
-                if dry_run:
-                    print(f"[DRY-RUN] Would remove: {file_path}")
-                else:
-                    try:
-                        file_path.unlink()
-                        print(f"Removed: {file_path}")
-                        removed += 1
-                    except Exception as e:
-                        print(f"Failed to remove {file_path}: {e}")
-
-        # 2. Remove entire `.qc` subdirectories (subdir mode)
-        for d in dirnames:
-            if d == ".qc":
-                qc_dir = p / d
-                if dry_run:
-                    print(f"[DRY-RUN] Would remove directory: {qc_dir}")
+    Walks the tree once with os.scandir. `.qc` folders are handed to
+    shutil.rmtree without descending into them first. Symlinked directories
+    are not followed.
+    """
+    removed = 0
+    stack = [os.fspath(root)]
+
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable/vanished directory: skip it, as os.walk does
+            continue
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # 2. Remove entire `.qc` subdirectories (subdir mode)
+                if entry.name == QC_DIR_NAME:
+                    removed += _remove_qc_dir(Path(entry.path), dry_run)
                 else:
-                    try:
-                        for sub in qc_dir.rglob("*"):
-                            try:
-                                sub.unlink()
-                            except IsADirectoryError:
-                                pass
-                        qc_dir.rmdir()
-                        print(f"Removed directory: {qc_dir}")
-                        removed += 1
-                    except Exception as e:
-                        print(f"Failed to remove {qc_dir}: {e}")
+                    stack.append(entry.path)
+            elif should_remove_file(entry.name):
+                # 1. Remove known sidecar / cache files
+                removed += _remove_file(Path(entry.path), dry_run)
 
     return removed
 
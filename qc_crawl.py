@@ -9,24 +9,18 @@ qc-asset-crawler
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
 from datetime import datetime, timezone
 
-import dotenv
 from pathlib import Path
-from qc_asset_crawler import crawler, sidecar
-from qc_asset_crawler.mutation import SequenceMutationConfig
+from qc_asset_crawler import jsonio
 
-try:
-    # Optional: nicer colours on Windows
-    import colorama
-
-    colorama.init()
-except Exception:
-    colorama = None
+# dotenv, colorama and the crawler modules (requests, blake3, ...) are imported
+# inside main()/configure_logging(), so --help and argument errors don't pay
+# for them.
+colorama = None
 
 
 def find_data_file(filename: str) -> str:
@@ -37,7 +31,28 @@ def find_data_file(filename: str) -> str:
     return os.path.join(datadir, filename)
 
 
-dotenv.load_dotenv(find_data_file(".env"))
+def load_env_file() -> None:
+    """Load the .env next to this script, if there is one."""
+    env_file = find_data_file(".env")
+    if not os.path.isfile(env_file):
+        return
+    import dotenv
+
+    dotenv.load_dotenv(env_file)
+
+
+def _init_colour() -> None:
+    """Optional: nicer colours on Windows (colorama), initialised once."""
+    global colorama
+    if colorama is not None:
+        return
+    try:
+        import colorama as _colorama
+
+        _colorama.init()
+        colorama = _colorama
+    except Exception:
+        colorama = False
 
 
 # ----------------- Logging helpers -----------------
@@ -45,7 +60,13 @@ dotenv.load_dotenv(find_data_file(".env"))
 
 class IgnoreEmptyMessageFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        return bool(record.getMessage().strip())
+        if not record.args:
+            # Nothing to interpolate: check the template as-is
+            return bool(str(record.msg).strip())
+        message = record.getMessage()
+        # Keep the rendered text so the formatter doesn't %-format it again
+        record.msg, record.args = message, None
+        return bool(message.strip())
 
 
 class ColourFormatter(logging.Formatter):
@@ -70,12 +91,32 @@ class ColourFormatter(logging.Formatter):
 
     RESET = "\033[0m"
 
+    # Bound once; skips the super() lookup on every record
+    _base_format = logging.Formatter.format
+
+    # (second, datefmt) -> rendered asctime of the most recent record
+    _last_time: tuple[tuple[int, str], str] | None = None
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        # An explicit datefmt goes through time.strftime, which has one-second
+        # resolution, and consecutive records nearly always share a second:
+        # reuse the last rendering instead of localtime() + strftime() per line.
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        key = (int(record.created), datefmt)
+        last = self._last_time
+        if last is not None and last[0] == key:
+            return last[1]
+        text = super().formatTime(record, datefmt)
+        self._last_time = (key, text)
+        return text
+
     def format(self, record: logging.LogRecord) -> str:
-        base = super().format(record)
+        base = self._base_format(record)
         colour = self.COLOURS.get(record.levelno)
-        if not colour:
+        if colour is None:
             return base
-        return f"{colour}{base}{self.RESET}"
+        return colour + base + self.RESET
 
 
 class JsonFormatter(logging.Formatter):
@@ -83,11 +124,13 @@ class JsonFormatter(logging.Formatter):
     Emit one JSON object per log line, suitable for ingestion by log tools.
     """
 
+    _fromtimestamp = datetime.fromtimestamp
+    _UTC = timezone.utc
+
     def format(self, record: logging.LogRecord) -> str:
         payload = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            # Serialised by jsonio (natively under orjson)
+            "timestamp": self._fromtimestamp(record.created, self._UTC),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -96,7 +139,22 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, ensure_ascii=False)
+        return jsonio.dumps_line(payload)
+
+
+# --log names; anything else falls back to INFO. (A getattr() on the logging
+# module would also "accept" names like BASIC_FORMAT.)
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# ((level, json_logs, stream), handler) from the last configure_logging()
+_CURRENT_CFG: tuple[tuple, logging.Handler] | None = None
 
 
 def configure_logging(
@@ -117,15 +175,26 @@ def configure_logging(
     json_logs:
         If True, emit machine-readable JSON log lines instead of coloured text.
     """
-    # Clear any existing handlers (important if main() is called more than once)
+    global _CURRENT_CFG
+
     root = logging.getLogger()
-    for h in list(root.handlers):
-        root.removeHandler(h)
 
-    level = getattr(logging, level_name.upper(), logging.INFO)
+    level = _LEVELS.get(level_name.upper(), logging.INFO)
     if quiet and level < logging.WARNING:
         level = logging.WARNING
 
+    # Same settings as last time and our handler is still the only one
+    # installed: keep it rather than tearing down and rebuilding.
+    cfg = (level, json_logs, sys.stdout)
+    if _CURRENT_CFG is not None and _CURRENT_CFG[0] == cfg:
+        if root.handlers == [_CURRENT_CFG[1]]:
+            root.setLevel(level)
+            return
+
+    # Clear any existing handlers (important if main() is called more than once)
+    for h in list(root.handlers):
+        root.removeHandler(h)
+
     root.setLevel(level)
 
     handler = logging.StreamHandler(sys.stdout)
@@ -134,6 +203,7 @@ def configure_logging(
         fmt: logging.Formatter = JsonFormatter()
     else:
         # Use ANSI colours for human-readable console logs
+        _init_colour()
         fmt = ColourFormatter(
             fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         )
@@ -143,6 +213,7 @@ def configure_logging(
 
     handler.setFormatter(fmt)
     root.addHandler(handler)
+    _CURRENT_CFG = (cfg, handler)
 
     # Reduce noise from common libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -169,6 +240,24 @@ def main() -> int:
         type=int,
         default=max(os.cpu_count() or 4, 4),
     )
+    ap.add_argument(
+        "--processes",
+        action="store_true",
+        help=(
+            "Run workers as separate processes instead of threads. Helps "
+            "change-heavy crawls of many small files; threads (the default) "
+            "suit runs dominated by NFS/SMB latency."
+        ),
+    )
+    ap.add_argument(
+        "--hash-algo",
+        choices=["auto", "blake3", "sha256"],
+        default="auto",
+        help=(
+            "Content hash algorithm. auto prefers blake3 when installed; pin "
+            "one when several hosts crawl the same tree."
+        ),
+    )
     ap.add_argument(
         "--log",
         default="INFO",
@@ -210,6 +299,11 @@ def main() -> int:
             "Default: subdir"
         ),
     )
+    ap.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent sidecar JSON for human inspection (default: compact).",
+    )
     ap.add_argument(
         "--result",
         choices=["pass", "fail", "pending"],
@@ -248,6 +342,13 @@ def main() -> int:
     )
     args = ap.parse_args()
 
+    # Loaded before the crawler modules are imported, so .env values are in
+    # place for anything they read at import time.
+    load_env_file()
+
+    from qc_asset_crawler import crawler, hashing, sidecar, trak_client
+    from qc_asset_crawler.mutation import SequenceMutationConfig
+
     # Initialise logging using module-level configure_logging (no nested def!)
     configure_logging(
         level_name=args.log,
@@ -274,6 +375,25 @@ def main() -> int:
 
     # keep sidecar module in sync so it knows where to write
     sidecar.G_SIDECAR_MODE = args.sidecar_mode
+    sidecar.G_PRETTY_SIDECARS = args.pretty
+
+    # One pooled keep-alive connection per worker thread
+    trak_client.G_WORKERS = args.workers
+
+    try:
+        backend = hashing.set_hash_backend(args.hash_algo)
+    except RuntimeError as e:
+        ap.error(str(e))
+    if args.hash_algo == "auto" and backend != "blake3":
+        # Several times slower on changed content; say so once, up front.
+        logging.warning(
+            "blake3 is not installed; hashing with SHA-256. Install blake3 "
+            "(see requirements.txt) or pin --hash-algo sha256 to silence this."
+        )
+
+    # Share the cores between crawl workers and blake3's per-file threads:
+    # one worker gets them all, a saturated pool hashes single-threaded.
+    hashing.G_HASH_THREADS = max((os.cpu_count() or 1) // max(args.workers, 1), 1)
 
     roots = [Path(r).resolve() for r in args.root]
     asset_ids = args.asset_ids  # may be None or a list of strings
@@ -289,6 +409,7 @@ def main() -> int:
         workers=args.workers,
         min_seq=args.min_seq,
         asset_ids=asset_ids,
+        use_processes=args.processes,
     )
 
 
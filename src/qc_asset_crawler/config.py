@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import functools
 import os
 
 
+# Both values are read from the environment once per process, on first use
+# (after qc_crawl.py has loaded .env), because they are needed for every
+# asset. Call <getter>.cache_clear() after changing the environment.
+
+
+@functools.lru_cache(maxsize=1)
 def get_tool_version() -> str:
     """Return the tool version string used in sidecars and logs."""
     return os.environ.get("TOOL_VERSION", "eikon-qc-marker/1.1.0")
 
 
+@functools.lru_cache(maxsize=1)
 def get_xattr_key() -> str:
     """
     Return the extended-attribute key used to tag files with QC IDs.
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import collections
 import concurrent.futures
+import functools
+import itertools
 import logging
+import multiprocessing
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 
 from qc_asset_crawler.sequences import (
+    MEDIA_EXTS,
     iter_media,
     group_sequences,
     summarize_frames,
@@ -27,10 +34,146 @@ G_NOTE: str | None = None
 G_MUTATION_CONFIG: SequenceMutationConfig | None = None
 G_SHOW_MUTATION_DIFF: bool = False
 
+# Platform xattr setter, picked once: os.setxattr on Linux, the optional
+# `xattr` package on macOS, otherwise None (QC ids are then not tagged).
+if sys.platform.startswith("linux"):
+    _SETXATTR = os.setxattr
+elif sys.platform == "darwin":
+    try:
+        import xattr as _xattr
+
+        _SETXATTR = _xattr.setxattr
+    except ImportError:
+        _SETXATTR = None
+else:
+    _SETXATTR = None
+
+
+@functools.lru_cache(maxsize=1)
+def _xattr_key() -> bytes:
+    """config.get_xattr_key(), encoded once rather than by every setxattr call."""
+    return os.fsencode(config.get_xattr_key())
+
 
 # ----------------- Helpers -----------------
 
 
+def _worker_settings() -> dict:
+    """
+    Snapshot the CLI-driven module globals so process-pool workers can be
+    initialised with the same configuration as the parent.
+    """
+    return {
+        "G_SIDECAR_MODE": G_SIDECAR_MODE,
+        "G_FORCED_RESULT": G_FORCED_RESULT,
+        "G_NOTE": G_NOTE,
+        "G_MUTATION_CONFIG": G_MUTATION_CONFIG,
+        "G_SHOW_MUTATION_DIFF": G_SHOW_MUTATION_DIFF,
+        "sidecar_mode": getattr(sidecar, "G_SIDECAR_MODE", "inline"),
+        "pretty_sidecars": sidecar.G_PRETTY_SIDECARS,
+        "hash_threads": hashing.G_HASH_THREADS,
+        "hash_backend": hashing.hash_backend(),
+    }
+
+
+def _init_worker(settings: dict, cpu_slots=None) -> None:
+    """
+    ProcessPoolExecutor initializer.
+
+    Module globals are not shared with child processes (and are not inherited
+    at all under the "spawn" start method), so restore them explicitly.
+    cpu_slots is the shared counter from _cpu_slot_counter, or None to leave
+    the worker unpinned.
+    """
+    global G_SIDECAR_MODE, G_FORCED_RESULT, G_NOTE
+    global G_MUTATION_CONFIG, G_SHOW_MUTATION_DIFF
+
+    G_SIDECAR_MODE = settings["G_SIDECAR_MODE"]
+    G_FORCED_RESULT = settings["G_FORCED_RESULT"]
+    G_NOTE = settings["G_NOTE"]
+    G_MUTATION_CONFIG = settings["G_MUTATION_CONFIG"]
+    G_SHOW_MUTATION_DIFF = settings["G_SHOW_MUTATION_DIFF"]
+    sidecar.G_SIDECAR_MODE = settings["sidecar_mode"]
+    sidecar.G_PRETTY_SIDECARS = settings["pretty_sidecars"]
+    hashing.G_HASH_THREADS = settings["hash_threads"]
+    # Sibling pool processes can't see each other's large hashes
+    hashing.G_SHARE_IDLE_CORES = False
+    hashing.set_hash_backend(settings["hash_backend"])
+    if cpu_slots is not None:
+        _pin_worker(cpu_slots, settings["hash_threads"])
+    trak_client.start_qc_poster()
+
+
+def get_pin_workers() -> bool:
+    """
+    Return True if --processes workers should be pinned to their own CPUs.
+
+    On by default; QC_PIN_WORKERS=0 turns it off, e.g. on shared render or
+    ingest hosts where other jobs own some of the CPUs.
+    """
+    value = os.environ.get("QC_PIN_WORKERS", "1")
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def _cpu_slot_counter(workers: int):
+    """
+    Shared counter handing each pool process its CPU slot, or None when
+    pinning is off (get_pin_workers) or wouldn't help: no sched_setaffinity,
+    or more workers than usable CPUs (pinned workers would then be stacked on
+    the same cores).
+    """
+    if not get_pin_workers() or not hasattr(os, "sched_setaffinity"):
+        return None
+    if workers > len(os.sched_getaffinity(0)):
+        return None
+    return multiprocessing.Value("i", 0)
+
+
+def _worker_cpus(slot: int, allowed: list[int], per_worker: int) -> set[int]:
+    """
+    The per_worker CPUs (out of allowed) for the worker in the given slot.
+    Consecutive slots get adjacent, non-overlapping runs, wrapping around.
+    """
+    per_worker = min(max(per_worker, 1), len(allowed))
+    start = slot * per_worker
+    return {allowed[(start + i) % len(allowed)] for i in range(per_worker)}
+
+
+def _pin_worker(cpu_slots, per_worker: int) -> None:
+    """
+    Pin this pool process to its own CPUs, so the scheduler doesn't migrate
+    it (and its warm caches) while it hashes. Each worker gets as many CPUs
+    as blake3 may use threads for one file.
+    """
+    with cpu_slots.get_lock():
+        slot = cpu_slots.value
+        cpu_slots.value += 1
+    # Respect any affinity already imposed on the crawl (taskset, cgroups)
+    allowed = sorted(os.sched_getaffinity(0))
+    cpus = _worker_cpus(slot, allowed, per_worker)
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logging.debug("Could not pin worker to CPUs %s: %s", sorted(cpus), e)
+
+
+def _make_executor(workers: int, use_processes: bool) -> concurrent.futures.Executor:
+    """
+    Build the worker pool for a crawl.
+
+    Threads are the default: blake3/hashlib release the GIL while hashing and
+    tests rely on in-process monkeypatching. Processes avoid GIL contention in
+    the Python-side work (stat, dict updates, JSON) on very large crawls.
+    """
+    if use_processes:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(_worker_settings(), _cpu_slot_counter(workers)),
+        )
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+
 def build_mutation_config(args) -> SequenceMutationConfig | None:
     """
     Build mutation config from CLI args.
@@ -62,21 +205,40 @@ def safe_rel(path: Path, root: Path) -> str:
 
 
 def set_xattr(path: Path, value: str) -> None:
+    if _SETXATTR is None:
+        return
     try:
-        if sys.platform.startswith("linux"):
-            os.setxattr(path.as_posix(), config.get_xattr_key(), value.encode("utf-8"))
-        elif sys.platform == "darwin":
-            import xattr
-
-            xattr.setxattr(
-                path.as_posix(), config.get_xattr_key(), value.encode("utf-8")
-            )
+        _SETXATTR(os.fspath(path), _xattr_key(), value.encode("utf-8"))
     except Exception:
         # best-effort only
         pass
 
 
-def _sequence_media_exists(seq_root: Path, seq_info: dict) -> bool:
+def _media_by_dir(files: Iterable[Path]) -> dict[str, list[tuple[str, str]]]:
+    """
+    Map each directory (as a string) to [(name, lowercased suffix)] for the
+    media files iter_media found in it, so later passes need no re-listing.
+    """
+    out: dict[str, list[tuple[str, str]]] = {}
+    sep = os.sep
+    for p in files:
+        # iter_media paths are "<dir><sep><name>": slice, as group_sequences does
+        s = os.fspath(p)
+        cut = s.rfind(sep)
+        dirname, name = s[:cut], s[cut + 1 :]
+        entry = (name, os.path.splitext(name)[1].lower())
+        try:
+            out[dirname].append(entry)
+        except KeyError:
+            out[dirname] = [entry]
+    return out
+
+
+def _sequence_media_exists(
+    seq_root: Path,
+    seq_info: dict,
+    dir_contents: dict[str, list[tuple[str, str]]] | None = None,
+) -> bool:
     """
     Return True if there appear to be any media frames left for this sequence.
 
@@ -84,29 +246,47 @@ def _sequence_media_exists(seq_root: Path, seq_info: dict) -> bool:
       - base: filename prefix (without trailing dot)
       - ext: extension without leading dot (e.g. 'tif')
     and look for files in seq_root that match that (loosely).
-    """
-    if not seq_root.exists() or not seq_root.is_dir():
-        return False
 
+    If `dir_contents` (see _media_by_dir) has a listing for seq_root it is
+    searched instead of the directory. It only holds visible media files, so
+    it is used only when every possible match would be one of those.
+    """
     base = (seq_info.get("base") or "").strip()
     ext = (seq_info.get("ext") or "").lstrip(".").lower()
 
     expected_suffix = f".{ext}" if ext else None
 
-    try:
-        for child in seq_root.iterdir():
-            if not child.is_file():
-                continue
-
-            if expected_suffix and child.suffix.lower() != expected_suffix:
-                continue
-
-            if base and not child.name.startswith(base):
-                continue
+    if (
+        dir_contents is not None
+        and expected_suffix in MEDIA_EXTS
+        and not base.startswith(".")
+    ):
+        listing = dir_contents.get(os.fspath(seq_root))
+        if listing is not None:
+            return any(
+                suffix == expected_suffix and name.startswith(base)
+                for name, suffix in listing
+            )
 
-            # Found at least one plausible frame
-            return True
-    except FileNotFoundError:
+    # Plain string tests on DirEntry names; no Path objects or per-entry
+    # stat (is_file() comes from the entry type, except for symlinks, and is
+    # only asked once the name matches). The allocation-free base test runs
+    # first, and only the name's tail is case-folded for the suffix test.
+    n_suffix = len(expected_suffix) if expected_suffix else 0
+    try:
+        with os.scandir(seq_root) as it:
+            for entry in it:
+                name = entry.name
+                if base and not name.startswith(base):
+                    continue
+                if n_suffix and not (
+                    len(name) > n_suffix and name[-n_suffix:].lower() == expected_suffix
+                ):
+                    continue
+                if entry.is_file():
+                    # Found at least one plausible frame
+                    return True
+    except (FileNotFoundError, NotADirectoryError):
         return False
 
     return False
@@ -121,30 +301,57 @@ def _iter_sidecars_under_root(root: Path):
       - Subdir sidecars: .qc/file.ext.qc.json  (also match *.qc.json)
       - Sequence sidecars: e.g. sequence.qc.json, .sequence.qc.json
         (name comes from sidecar.get_side_name_sequence()).
+
+    One os.scandir walk matches all patterns by name (hidden directories such
+    as .qc included); directory-vs-file comes from the entry type, so entries
+    are never stat()ed and each is seen once. Symlinked directories are not
+    followed, as with rglob.
     """
-    seen = set()
+    seq_name = sidecar.get_side_name_sequence()
+    seq_names = {seq_name, f".{seq_name}"}
+
+    stack = [os.fspath(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    if name.endswith(".qc.json") or name in seq_names:
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable/vanished directory: skip it
+            continue
 
-    # All per-file sidecars (inline, dot, subdir) end with .qc.json
-    for p in root.rglob("*.qc.json"):
-        if p not in seen:
-            seen.add(p)
-            yield p
 
-    # Sequence sidecars: sequence.qc.json / .sequence.qc.json (plus subdir variants)
-    seq_name = sidecar.get_side_name_sequence()
-    for name in (seq_name, f".{seq_name}"):
-        for p in root.rglob(name):
-            if p not in seen:
-                seen.add(p)
-                yield p
+def _is_under(path: Path, root_str: str) -> bool:
+    """String-only Path.relative_to check: is path root_str or inside it?"""
+    path_str = os.fspath(path)
+    return path_str == root_str or path_str.startswith(os.path.join(root_str, ""))
 
 
-def mark_missing_content(root: Path) -> int:
+def mark_missing_content(
+    root: Path,
+    dir_contents: dict[str, list[tuple[str, str]]] | None = None,
+    workers: int = 1,
+) -> int:
     """
     For any sidecar under `root` whose media no longer exists on disk,
     set content_state = "missing" (without changing qc_id / qc_result /
     last_valid_qc_*).
 
+    `dir_contents` is the crawl's own media listing (see _media_by_dir); it
+    saves re-listing sequence directories the crawl has just walked.
+    Sidecars are independent of each other, so with workers > 1 they are
+    checked on a thread pool (the work is read/stat/write IO).
+
     Singles:
       - asset_path points to the media file; we mark missing when the file is gone.
 
@@ -152,68 +359,123 @@ def mark_missing_content(root: Path) -> int:
       - asset_path points to the sequence directory; we mark missing when there
         are no frames left in that directory matching the recorded base/ext.
     """
-    missing_count = 0
     root = root.resolve()
+    check = functools.partial(
+        _mark_if_missing, root=root, root_str=os.fspath(root), dir_contents=dir_contents
+    )
+    sidecars = _iter_sidecars_under_root(root)
 
-    for sc in _iter_sidecars_under_root(root):
-        data = sidecar.read_sidecar(sc)
-        if not data:
-            continue
+    if workers <= 1:
+        return sum(map(check, sidecars))
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="qc-missing"
+    ) as ex:
+        return sum(ex.map(check, sidecars))
 
-        asset_path_str = data.get("asset_path")
-        if not asset_path_str:
-            continue
 
-        ap = Path(asset_path_str)
+def _mark_if_missing(
+    sc: Path,
+    root: Path,
+    root_str: str,
+    dir_contents: dict[str, list[tuple[str, str]]] | None,
+) -> int:
+    """mark_missing_content for one sidecar: return 1 if it was marked."""
+    data = sidecar.read_sidecar(sc)
+    if not data:
+        return 0
 
-        # If the asset_path is relative, treat it as relative to the crawl root.
-        if not ap.is_absolute():
-            ap = (root / ap).resolve()
-        else:
-            ap = ap.resolve()
+    asset_path_str = data.get("asset_path")
+    if not asset_path_str:
+        return 0
+
+    ap = Path(asset_path_str)
+
+    # If the asset_path is relative, treat it as relative to the crawl root.
+    # Absolute paths already spelled under the (resolved) root are used
+    # as-is: resolving costs a stat per path component, and only changes
+    # the answer for ".." or a path written via a symlink/other mount.
+    canonical = ap.is_absolute() and ".." not in ap.parts and _is_under(ap, root_str)
+    if not canonical:
+        ap = (root / ap).resolve()
 
         # Optionally ignore stuff clearly outside the root, to be safe.
-        try:
-            _ = ap.relative_to(root)
-        except Exception:
-            continue
+        if not _is_under(ap, root_str):
+            return 0
 
-        seq_info = data.get("sequence")
+    seq_info = data.get("sequence")
 
-        # --- Sequence sidecars: asset_path is the sequence directory ---
-        if isinstance(seq_info, dict) and seq_info:
-            seq_root = ap if ap.is_dir() else ap.parent
+    # --- Sequence sidecars: asset_path is the sequence directory ---
+    if isinstance(seq_info, dict) and seq_info:
+        seq_root = ap if ap.is_dir() else ap.parent
 
-            media_exists = _sequence_media_exists(seq_root, seq_info)
+        if _sequence_media_exists(seq_root, seq_info, dir_contents):
+            # There are still frames; nothing to do.
+            return 0
 
-            if media_exists:
-                # There are still frames; nothing to do.
-                continue
+    # --- Single-file sidecars: asset_path is the media file ---
+    elif ap.exists():
+        return 0
 
-            # Already marked as missing? No need to rewrite.
-            if data.get("content_state") == "missing":
-                continue
+    # Already marked as missing? No need to rewrite.
+    if data.get("content_state") == "missing":
+        return 0
 
-            data["content_state"] = "missing"
-            sidecar.write_sidecar(sc, data)
-            missing_count += 1
-            continue
+    data["content_state"] = "missing"
+    sidecar.write_sidecar(sc, data)
+    return 1
 
-        # --- Single-file sidecars: asset_path is the media file ---
-        if ap.exists():
-            continue
 
-        if data.get("content_state") == "missing":
-            continue
+# ----------------- Processing -----------------
+
 
-        data["content_state"] = "missing"
-        sidecar.write_sidecar(sc, data)
-        missing_count += 1
+def _call_and_flush(fn, *args):
+    """
+    Process-pool task wrapper.
 
-    return missing_count
+    Pool workers exit without running atexit handlers and never see the end of
+    the run, so write back this task's hash caches and finish its Trak posts
+    before returning.
+    """
+    try:
+        return fn(*args)
+    finally:
+        hashcache.flush_hashcaches()
+        trak_client.flush_qc_posts()
 
 
-# ----------------- Processing -----------------
+def _batch_size(n_items: int, workers: int) -> int:
+    """Items per process-pool task: ~4 batches per worker, as Pool.map does."""
+    return max(1, n_items // (max(workers, 1) * 4))
+
+
+def _interleaved_batches(items: list, step: int) -> list[list]:
+    """
+    Split items into batches of about `step`, dealt round-robin.
+
+    Items arrive sorted largest first, so contiguous slices would put all the
+    big files in the first batch; dealing them out gives each batch a similar
+    share of the work and keeps every batch largest first.
+    """
+    n_batches = -(-len(items) // max(step, 1))
+    return [items[i::n_batches] for i in range(n_batches)]
+
+
+def _process_singles_batch(paths: list[Path], operator: str, asset_id: str | None):
+    """
+    Process-pool task: run process_single_file over a batch of paths.
+
+    Singles are cheap compared to the pickling/IPC round-trip of one future
+    each, so process mode ships them in batches. A failure on one path is
+    logged and reported as ("error", path) without losing the rest.
+    """
+    out = []
+    for p in paths:
+        try:
+            out.append(process_single_file(p, operator, asset_id))
+        except Exception as e:
+            logging.error("Worker error on %s: %s", p, e, exc_info=True)
+            out.append(("error", p))
+    return out
 
 
 def process_single_file(
@@ -230,18 +492,41 @@ def process_single_file(
     - If G_FORCED_RESULT is set (operator run): always rewrite the sidecar, even if bytes/policy
       are unchanged, so operators can change pass/fail/notes.
     """
+    # Read the CLI globals once; they are fixed for the whole run.
+    forced = G_FORCED_RESULT
+
     sc = sidecar.sidecar_path_for_file(p)
+    stat_fp = hashing.stat_fingerprint(os.stat(p))
     existing = sidecar.read_sidecar(sc)
+    existing_content_hash = existing.get("content_hash") if existing else None
+
+    # Fast-path skip for automated runs: size, mtime_ns and inode are what the
+    # hashcache trusts for frames, so if none moved since the stored hash was
+    # taken the hash can't have changed either. needs_reqc() against the
+    # stored hash then reduces to its policy check, done inline here.
+    if (
+        forced is None
+        and existing_content_hash
+        and existing.get("stat_fp") == stat_fp
+        and existing.get("policy_version") == sidecar.get_qc_policy_version()
+    ):
+        return ("skip", p)
 
-    # Always hash the single file – there's no cheap_fp here.
     ch = hashing.blake3_or_sha256_file(p)
 
     # Detect whether content has actually changed vs stored sidecar
-    existing_content_hash = existing.get("content_hash") if existing else None
     content_changed = existing_content_hash is None or existing_content_hash != ch
 
     # For automated runs (no explicit result), skip if content & policy unchanged.
-    if G_FORCED_RESULT is None and not sidecar.needs_reqc(existing, ch):
+    if forced is None and not sidecar.needs_reqc(existing, ch):
+        # But record stat_fp if missing or changed, so the next run takes the
+        # fast path. Unlike a sequence's cheap_fp (backfilled only when
+        # missing), a stale stat_fp is refreshed too: it gates the
+        # unattended skip above, and singles have no hashcache, so leaving it
+        # stale would mean a full rehash of the file on every run.
+        if existing.get("stat_fp") != stat_fp:
+            existing["stat_fp"] = stat_fp
+            sidecar.write_sidecar(sc, existing)
         return ("skip", p)
 
     # Prefer explicit asset_id from CLI, then Trak lookup, then existing sidecar
@@ -262,7 +547,7 @@ def process_single_file(
     # Default behaviour for Option A:
     # - No forced result: always "pending" when we (re)write a sidecar.
     # - Forced result: use operator's override.
-    result = G_FORCED_RESULT if G_FORCED_RESULT is not None else "pending"
+    result = forced if forced is not None else "pending"
 
     sig = qcstate.make_qc_signature(
         p,
@@ -272,10 +557,11 @@ def process_single_file(
         result=result,
         note=G_NOTE,
     )
+    sig["stat_fp"] = stat_fp
 
     # --- Preserve qc_id for non-operator (nightly/bot) runs ---
     # Nightly content-change detection should NOT create a new QC event ID.
-    if existing and G_FORCED_RESULT is None and existing.get("qc_id"):
+    if existing and forced is None and existing.get("qc_id"):
         sig["qc_id"] = existing["qc_id"]
 
     # --- content_state + prev_content_hash ---
@@ -302,7 +588,7 @@ def process_single_file(
         prev_last_valid_qc_id = None
         prev_last_valid_qc_time = None
 
-    if G_FORCED_RESULT is not None and sig.get("qc_result") != "pending":
+    if forced is not None and sig.get("qc_result") != "pending":
         # New explicit QC event (operator result pass/fail/etc.)
         sig["last_valid_qc_id"] = sig["qc_id"]
         sig["last_valid_qc_time"] = sig["qc_time"]
@@ -324,11 +610,23 @@ def process_single_file(
     set_xattr(p, sig["qc_id"])
 
     # Use the effective asset id (CLI override or lookup) when posting to Trak
-    trak_client.tracker_set_qc(effective_asset_id, sig)
+    trak_client.post_qc(effective_asset_id, sig)
 
     return ("marked", p)
 
 
+def _cached_frame_hashes(cache: dict, names: list[str]) -> dict[str, str]:
+    """Return {name: hash} for the frames that have a hash in the hashcache."""
+    out: dict[str, str] = {}
+    for name in names:
+        try:
+            out[name] = cache[name]["hash"]
+        except (KeyError, TypeError):
+            # Not cached yet, or a malformed entry
+            continue
+    return out
+
+
 def process_sequence(
     dir_path: Path,
     base: str,
@@ -353,24 +651,37 @@ def process_sequence(
       based on the configured thresholds and hashcache-derived per-frame hashes,
       rather than simply any change in the manifest content_hash.
     """
+    # Read the CLI globals once; they are fixed for the whole run.
+    forced = G_FORCED_RESULT
+    mutation_config = G_MUTATION_CONFIG
+
     sc = sidecar.sequence_sidecar_path(dir_path)
 
-    cache = hashcache.load_hashcache(dir_path)
+    # Shared with any other sequence in this directory; written back once by
+    # hashcache.flush_hashcaches() at the end of the run.
+    cache = hashcache.shared_hashcache(dir_path)
+
+    names = [p.name for p in files]
 
-    # Snapshot previous per-file hashes for mutation detection, if enabled.
+    # Per-file hashes before/after this run for mutation detection, if enabled.
     # We use file names as identifiers within the sequence directory.
     previous_hashes: dict[str, str] = {}
-    if G_MUTATION_CONFIG is not None:
-        for p in files:
-            entry = cache.get(p.name)
-            if isinstance(entry, dict) and "hash" in entry:
-                previous_hashes[p.name] = entry["hash"]
+    current_hashes: dict[str, str] | None = None
+    if mutation_config is not None:
+        current_hashes = {}
 
-    cheap_fp = hashing.cheap_fingerprint(files)
+    # One stat() per frame, shared by the cheap fingerprint and manifest hash.
+    entries = hashing.stat_entries(files)
+    cheap_fp = hashing.cheap_fingerprint(entries)
     existing = sidecar.read_sidecar(sc)
 
     existing_content_hash = existing.get("content_hash") if existing else None
-    operator_forced = G_FORCED_RESULT is not None
+    operator_forced = forced is not None
+    policy_version = sidecar.get_qc_policy_version()
+    # Compared once; both the operator reuse and the re-QC decision need it.
+    policy_unchanged = bool(existing) and (
+        existing.get("policy_version") == policy_version
+    )
 
     # ---------- Fast-path skip for automated runs ----------
     # If cheap fingerprint hasn't changed and policy unchanged, we can skip deep hashing & QC
@@ -389,35 +700,37 @@ def process_sequence(
     # if we can confidently say content didn't change (cheap_fp + policy).
     if (
         operator_forced
-        and existing
-        and existing.get("policy_version") == sidecar.get_qc_policy_version()
+        and policy_unchanged
         and (existing.get("sequence") or {}).get("cheap_fp") == cheap_fp
         and existing.get("content_hash")
     ):
         # Content appears unchanged; reuse previous manifest hash.
         seq_hash = existing["content_hash"]
+        if current_hashes is not None:
+            # Nothing is hashed, so the cache is both the before and the after
+            current_hashes = _cached_frame_hashes(cache, names)
+            previous_hashes = current_hashes
     else:
-        # Deep hashing with cache
-        seq_hash = hashing.manifest_hash_for_files(files, cache)
-        hashcache.save_hashcache(dir_path, cache)
+        # Deep hashing with cache; the before/after per-frame hashes for
+        # mutation detection are collected in the same pass over the frames
+        if current_hashes is None:
+            seq_hash = hashing.manifest_hash_for_files(entries, cache)
+        else:
+            seq_hash = hashing.manifest_hash_for_files(
+                entries, cache, current_hashes, previous_hashes
+            )
+        hashcache.mark_hashcache_dirty(dir_path)
 
     # Determine if the content has actually changed vs what was stored
     content_changed = existing_content_hash is None or existing_content_hash != seq_hash
 
     # ---------- Optional sequence-level mutation detection ----------
     mutation_result = None
-    if G_MUTATION_CONFIG is not None:
-        # Build current per-file hashes from the (now updated) cache.
-        current_hashes: dict[str, str] = {}
-        for p in files:
-            entry = cache.get(p.name)
-            if isinstance(entry, dict) and "hash" in entry:
-                current_hashes[p.name] = entry["hash"]
-
+    if mutation_config is not None:
         mutation_result = detect_sequence_mutation(
             previous_hashes=previous_hashes,
             current_hashes=current_hashes,
-            config=G_MUTATION_CONFIG,
+            config=mutation_config,
         )
 
         if existing and G_SHOW_MUTATION_DIFF:
@@ -437,7 +750,7 @@ def process_sequence(
                     dir_path / f"{base}*.{ext}",
                     added,
                 )
-            if removed and G_MUTATION_CONFIG.count_removed_frames:
+            if removed and mutation_config.count_removed_frames:
                 logging.info(
                     "Sequence %s: removed frames: %s",
                     dir_path / f"{base}*.{ext}",
@@ -448,11 +761,9 @@ def process_sequence(
     # When mutation detection is enabled, we use its result instead of a simple
     # "content hash changed" check; otherwise we fall back to the original needs_reqc.
     if not operator_forced and existing:
-        policy_changed = (
-            existing.get("policy_version") != sidecar.get_qc_policy_version()
-        )
+        policy_changed = not policy_unchanged
 
-        if G_MUTATION_CONFIG is not None and mutation_result is not None:
+        if mutation_config is not None and mutation_result is not None:
             # Policy changes always require QC, regardless of content.
             if policy_changed:
                 needs_qc = True
@@ -464,10 +775,16 @@ def process_sequence(
             needs_qc = sidecar.needs_reqc(existing, seq_hash)
 
         if not needs_qc:
-            # But update cheap_fp if missing or changed
-            existing_seq = existing.setdefault("sequence", {}) or {}
-            if existing_seq.get("cheap_fp") != cheap_fp:
+            # Backfill cheap_fp for sidecars written without one. A stale one
+            # is left alone: it only gates the operator-run reuse above, and
+            # that falls back to a manifest pass the hashcache (refreshed by
+            # this run) answers without reading frames, so a touched frame
+            # isn't worth a sidecar rewrite. (process_single_file does refresh
+            # a stale stat_fp; a single has no hashcache to fall back on.)
+            existing_seq = existing.get("sequence") or {}
+            if not existing_seq.get("cheap_fp"):
                 existing_seq["cheap_fp"] = cheap_fp
+                existing["sequence"] = existing_seq
                 sidecar.write_sidecar(sc, existing)
             return ("skip", dir_path / f"{base}*.{ext}")
 
@@ -476,12 +793,8 @@ def process_sequence(
     # Normalize base/ext for storage
     nbase, next_ = normalize_base_ext(base, ext)
 
-    # Decide which asset_id to use:
-    existing = sidecar.read_sidecar(sc)
-    existing_content_hash = existing.get("content_hash") if existing else None
-
-    operator_forced = G_FORCED_RESULT is not None
-
+    # Decide which asset_id to use. `existing` is the sidecar read above;
+    # nothing on this path has rewritten it since.
     # Prefer explicit asset_id from CLI, then Trak directory/file lookup, then existing
     existing_asset_id = existing.get("asset_id") if existing else None
     effective_asset_id = asset_id
@@ -509,7 +822,7 @@ def process_sequence(
         effective_asset_id = existing_asset_id
 
     # Same result semantics as single files
-    result = G_FORCED_RESULT if G_FORCED_RESULT is not None else "pending"
+    result = forced if forced is not None else "pending"
 
     sig = qcstate.make_qc_signature(
         dir_path,
@@ -523,7 +836,7 @@ def process_sequence(
     # --- Preserve qc_id for non-operator (nightly/bot) runs ---
     # When content changes but QC is not yet redone, we keep the existing qc_id
     # and simply reset qc_result to "pending".
-    if existing and G_FORCED_RESULT is None and existing.get("qc_id"):
+    if existing and forced is None and existing.get("qc_id"):
         sig["qc_id"] = existing["qc_id"]
 
     # --- content_state + prev_content_hash for sequences ---
@@ -547,7 +860,7 @@ def process_sequence(
         prev_last_valid_qc_id = None
         prev_last_valid_qc_time = None
 
-    if G_FORCED_RESULT is not None and sig.get("qc_result") != "pending":
+    if forced is not None and sig.get("qc_result") != "pending":
         # this is a new human QC event
         sig["last_valid_qc_id"] = sig["qc_id"]
         sig["last_valid_qc_time"] = sig["qc_time"]
@@ -558,8 +871,7 @@ def process_sequence(
         if prev_last_valid_qc_time is not None:
             sig["last_valid_qc_time"] = prev_last_valid_qc_time
 
-        # Lightweight sequence summary
-        names = [p.name for p in files]
+    # Lightweight sequence summary
     summary = summarize_frames(names) or {}
     frame_count = len(names)
 
@@ -595,73 +907,203 @@ def process_sequence(
         pass
 
     # Use effective_asset_id here, same as in single-file path
-    trak_client.tracker_set_qc(effective_asset_id, sig)
+    trak_client.post_qc(effective_asset_id, sig)
 
     return ("marked", dir_path / f"{nbase}*.{next_}")
 
 
+def _iter_dir_groups(files: Iterable[Path]) -> Iterator[list[Path]]:
+    """
+    Split iter_media output into one list per directory. iter_media yields
+    each directory's media together, so a change of parent ends a directory.
+    """
+    group: list[Path] = []
+    current = None
+    sep = os.sep
+    for p in files:
+        s = os.fspath(p)
+        parent = s[: s.rfind(sep)]
+        if parent != current and group:
+            yield group
+            group = []
+        current = parent
+        group.append(p)
+    if group:
+        yield group
+
+
+# Job queue priorities for threaded runs: sequences (longest first) before
+# singles (largest first), and the end-of-walk marker after everything.
+_SEQUENCE_JOB, _SINGLE_JOB, _NO_MORE_JOBS = 0, 1, 2
+
+
+def _run_jobs(jobs: queue.PriorityQueue, results: list) -> None:
+    """
+    Thread-pool worker loop: run the highest-priority pending job until the
+    end-of-walk marker comes up. A failure is logged and recorded as
+    ("error", path), like _process_singles_batch does.
+    """
+    while True:
+        _kind, _cost, _n, fn, args = jobs.get()
+        if fn is None:
+            return
+        try:
+            results.append(fn(*args))
+        except Exception as e:
+            logging.error("Worker error on %s: %s", args[0], e, exc_info=True)
+            results.append(("error", args[0]))
+
+
+class _DirectoryCountdown:
+    """
+    Counts a directory's sequence jobs down as they finish; the last one
+    writes its shared hashcache (hashcache.flush_hashcache). A long threaded
+    crawl then holds only the caches of directories still in progress, and
+    an interrupted run keeps the frame hashes of every finished directory.
+    """
+
+    def __init__(self, dir_path: Path, n_jobs: int) -> None:
+        self._dir_path = dir_path
+        self._remaining = n_jobs
+        self._lock = threading.Lock()
+
+    def run_sequence(self, *args):
+        try:
+            return process_sequence(*args)
+        finally:
+            with self._lock:
+                self._remaining -= 1
+                last = self._remaining == 0
+            if last:
+                hashcache.flush_hashcache(self._dir_path)
+
+
+def _queue_directory(
+    jobs: queue.PriorityQueue,
+    order: Iterator[int],
+    dir_files: list[Path],
+    min_seq: int,
+    operator: str,
+    asset_id: str | None,
+) -> tuple[int, int]:
+    """
+    Group one directory's media and queue its jobs; return the number of
+    (sequences, singles) queued.
+
+    Frame count is a stat-free cost proxy for sequences; singles cost a stat
+    here, and the worker's own stat then hits the inode cache. The directory
+    is queued biggest first, so a worker already waiting on the queue gets
+    its largest job rather than the first one put.
+    """
+    sequences_map, singles = group_sequences(dir_files, min_seq=min_seq)
+    pending = []
+    if sequences_map:
+        # Every sequence here shares the directory (and its hashcache)
+        countdown = _DirectoryCountdown(
+            next(iter(sequences_map))[0], len(sequences_map)
+        )
+        pending = [
+            (
+                _SEQUENCE_JOB,
+                -len(members),
+                next(order),
+                countdown.run_sequence,
+                (d, base, ext, members, operator, asset_id),
+            )
+            for (d, base, ext), members in sequences_map.items()
+        ]
+    pending += [
+        (_SINGLE_JOB, -size, next(order), process_single_file, (p, operator, asset_id))
+        for size, p in zip(hashing.file_sizes(singles), singles)
+    ]
+    pending.sort(key=lambda job: job[:3])
+    for job in pending:
+        jobs.put(job)
+    return len(sequences_map), len(singles)
+
+
 def run(
     root: Path,
     operator: str,
     workers: int,
     min_seq: int,
     asset_id: str | None = None,
+    use_processes: bool = False,
 ) -> int:
-    """Run the crawler for a single root and log a concise summary."""
-    files = list(iter_media(root))
-    sequences_map, singles = group_sequences(files, min_seq=min_seq)
+    """
+    Run the crawler for a single root and log a concise summary.
 
-    logging.info(
-        "QC crawl starting for %s: %d media files (%d sequences, %d singles)",
-        root,
-        len(files),
-        len(sequences_map),
-        len(singles),
-    )
+    With threads, hashing starts while the tree is still being walked: each
+    directory's jobs are queued as soon as it has been listed, and idle
+    workers always take the biggest job queued so far. Process pools get
+    every job up front instead, sorted and batched (see _run_in_processes).
+    """
+    logging.info("QC crawl starting for %s", root)
+    logging.debug("Content hash backend: %s", hashing.hash_backend())
 
     results: list[tuple[str, Path]] = []
+    media_by_dir: dict[str, list[tuple[str, str]]] = {}
+    n_files = n_sequences = n_singles = 0
     worker_errors = 0
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
-        futs = [
-            ex.submit(
-                process_sequence,
-                d,
-                base,
-                ext,
-                members,
-                operator,
-                asset_id,
-            )
-            for (d, base, ext), members in sequences_map.items()
-        ]
-        futs += [
-            ex.submit(
-                process_single_file,
-                p,
-                operator,
-                asset_id,
-            )
-            for p in singles
-        ]
-
-        for f in concurrent.futures.as_completed(futs):
-            try:
-                results.append(f.result())
-            except Exception as e:  # pragma: no cover - defensive logging
-                worker_errors += 1
-                logging.error("Worker error: %s", e, exc_info=True)
-
-    marked = [p for (s, p) in results if s == "marked"]
-    skipped = [p for (s, p) in results if s == "skip"]
+    if use_processes:
+        files = list(iter_media(root))
+        sequences_map, singles = group_sequences(files, min_seq=min_seq)
+        media_by_dir = _media_by_dir(files)
+        n_files, n_sequences, n_singles = len(files), len(sequences_map), len(singles)
+        _log_walk(root, n_files, n_sequences, n_singles)
+        worker_errors = _run_in_processes(
+            sequences_map, singles, operator, workers, asset_id, results
+        )
+    else:
+        # Trak posts go to their own small IO pool so hashing workers don't
+        # wait on the network (process workers start one each in _init_worker)
+        trak_client.start_qc_poster()
+        jobs: queue.PriorityQueue = queue.PriorityQueue()
+        order = itertools.count()
+        try:
 
-    marked_count = len(marked)
-    skipped_count = len(skipped)
+            with _make_executor(workers, use_processes) as ex:
+                runners = [ex.submit(_run_jobs, jobs, results) for _ in range(workers)]
+                try:
+                    for dir_files in _iter_dir_groups(iter_media(root)):
+                        n_files += len(dir_files)
+                        media_by_dir.update(_media_by_dir(dir_files))
+                        queued_seqs, queued_singles = _queue_directory(
+                            jobs, order, dir_files, min_seq, operator, asset_id
+                        )
+                        n_sequences += queued_seqs
+                        n_singles += queued_singles
+                finally:
+                    for _ in runners:
+                        jobs.put((_NO_MORE_JOBS, 0, next(order), None, ()))
+                _log_walk(root, n_files, n_sequences, n_singles)
+
+                for f in runners:
+                    try:
+                        f.result()
+                    except Exception as e:  # pragma: no cover - defensive logging
+                        worker_errors += 1
+                        logging.error("Worker error: %s", e, exc_info=True)
+
+        finally:
+            # Drain queued posts even if the crawl is interrupted
+            trak_client.stop_qc_poster()
+
+    # One pass over the results for every status
+    counts = collections.Counter(s for (s, _p) in results)
+    worker_errors += counts["error"]
+
+    # One write per directory for everything hashed in this run
+    hashcache.flush_hashcaches()
+
+    marked_count = counts["marked"]
+    skipped_count = counts["skip"]
 
     logging.info("Marked: %d, Skipped: %d", marked_count, skipped_count)
 
     # Second pass: mark sidecars whose media has gone missing
-    missing = mark_missing_content(root)
+    missing = mark_missing_content(root, media_by_dir, workers=workers)
     if missing:
         logging.info("Marked missing: %d", missing)
 
@@ -670,8 +1112,8 @@ def run(
         "QC crawl summary for %s: sequences=%d, singles=%d, "
         "marked=%d, skipped=%d, missing_marked=%d, worker_errors=%d",
         root,
-        len(sequences_map),
-        len(singles),
+        n_sequences,
+        n_singles,
         marked_count,
         skipped_count,
         missing,
@@ -681,12 +1123,87 @@ def run(
     return 0
 
 
+def _log_walk(root: Path, n_files: int, n_sequences: int, n_singles: int) -> None:
+    logging.info(
+        "QC crawl walked %s: %d media files (%d sequences, %d singles)",
+        root,
+        n_files,
+        n_sequences,
+        n_singles,
+    )
+
+
+def _run_in_processes(
+    sequences_map: dict,
+    singles: list[Path],
+    operator: str,
+    workers: int,
+    asset_id: str | None,
+    results: list,
+) -> int:
+    """
+    Process every job in a process pool, appending to results; return the
+    number of tasks that raised.
+    """
+    worker_errors = 0
+
+    with _make_executor(workers, True) as ex:
+        submit = functools.partial(ex.submit, _call_and_flush)
+
+        # Longest sequences first (frame count as a stat-free cost proxy), so
+        # the biggest jobs don't start last and run alone at the tail.
+        by_length = sorted(
+            sequences_map.items(), key=lambda item: len(item[1]), reverse=True
+        )
+        futs = [
+            submit(
+                process_sequence,
+                d,
+                base,
+                ext,
+                members,
+                operator,
+                asset_id,
+            )
+            for (d, base, ext), members in by_length
+        ]
+        # Singles likewise go largest first. That costs a stat per file up
+        # front; the worker's own stat then hits the inode cache.
+        sizes = hashing.file_sizes(singles)
+        by_size = sorted(zip(sizes, singles), key=lambda t: t[0], reverse=True)
+        singles = [p for _size, p in by_size]
+
+        # Batch singles so each task amortises its IPC round-trip
+        batched = {
+            submit(_process_singles_batch, batch, operator, asset_id)
+            for batch in _interleaved_batches(
+                singles, _batch_size(len(singles), workers)
+            )
+        }
+        futs += batched
+
+        for f in concurrent.futures.as_completed(futs):
+            try:
+                res = f.result()
+            except Exception as e:  # pragma: no cover - defensive logging
+                worker_errors += 1
+                logging.error("Worker error: %s", e, exc_info=True)
+                continue
+            if f in batched:
+                results.extend(res)
+            else:
+                results.append(res)
+
+    return worker_errors
+
+
 def run_many(
     roots: Iterable[Path],
     operator: str,
     workers: int,
     min_seq: int,
     asset_ids: Iterable[str | None] | None = None,
+    use_processes: bool = False,
 ) -> int:
     """
     Run the crawler over multiple roots in a single invocation.
@@ -698,7 +1215,7 @@ def run_many(
     operator:
         Operator name / identifier to embed in sidecars.
     workers:
-        Max worker threads per root (passed through to `run`).
+        Max workers per root (passed through to `run`).
     min_seq:
         Minimum sequence length for grouping frames (passed through to `run`).
     asset_ids:
@@ -711,6 +1228,9 @@ def run_many(
           asset_id.
         - Any other length pairing is treated as a configuration error and the
           function returns a non-zero exit code.
+    use_processes:
+        If True, run workers in a process pool instead of a thread pool
+        (passed through to `run`).
 
     Returns
     -------
@@ -755,6 +1275,7 @@ def run_many(
             workers=workers,
             min_seq=min_seq,
             asset_id=asset_id,
+            use_processes=use_processes,
         )
         # Preserve the first non-zero exit code, but still process all roots
         if code != 0 and exit_code == 0:
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-import json
 import os
+import threading
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
+from qc_asset_crawler import jsonio
+
+
+# Per-process cache of loaded hashcaches (see shared_hashcache).
+_SHARED: dict[Path, dict[str, Any]] = {}
+_DIRTY: set[Path] = set()
+_SHARED_LOCK = threading.Lock()
+
 
 def get_hashcache_name() -> str:
     """Return the per-directory hash cache filename."""
@@ -19,10 +27,9 @@ def load_hashcache(dir_path: Path) -> dict[str, Any]:
     Returns an empty dict on any error or if the cache file does not exist.
     """
     f = dir_path / get_hashcache_name()
-    if not f.exists():
-        return {}
     try:
-        return json.loads(f.read_text(encoding="utf-8"))
+        # A missing file is just another error here, no separate exists()
+        return jsonio.loads(jsonio.read_file(f))
     except Exception:
         return {}
 
@@ -40,13 +47,7 @@ def save_hashcache(dir_path: Path, cache: Mapping[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write to temp file
-        with tmp.open("w", encoding="utf-8", newline="\n") as f:
-            json.dump(cache, f, indent=2, sort_keys=True)
-            f.flush()
-            try:
-                os.fsync(f.fileno())
-            except OSError:
-                pass
+        jsonio.write_file(tmp, jsonio.dumps(cache), fsync=True)
 
         # Atomic promotion
         os.replace(tmp, path)
@@ -59,3 +60,73 @@ def save_hashcache(dir_path: Path, cache: Mapping[str, Any]) -> None:
         except Exception:
             pass
         return
+
+
+def shared_hashcache(dir_path: Path) -> dict[str, Any]:
+    """
+    Return this process's shared hash cache dict for a directory.
+
+    The first caller loads it from disk; later callers (e.g. a second sequence
+    in the same folder) get the same dict, so the file is read once per run
+    and sibling sequences no longer overwrite each other's entries. Workers
+    only touch the keys of their own frames. Call mark_hashcache_dirty()
+    after updating it and flush_hashcaches() once the work is done.
+    """
+    key = Path(dir_path)
+    with _SHARED_LOCK:
+        cache = _SHARED.get(key)
+    if cache is not None:
+        return cache
+    loaded = load_hashcache(key)
+    with _SHARED_LOCK:
+        return _SHARED.setdefault(key, loaded)
+
+
+def mark_hashcache_dirty(dir_path: Path) -> None:
+    """Flag a shared hash cache as needing to be written by flush_hashcaches()."""
+    with _SHARED_LOCK:
+        _DIRTY.add(Path(dir_path))
+
+
+def flush_hashcaches() -> int:
+    """
+    Write every dirty shared hash cache and forget all shared caches.
+
+    Each cache is merged over the current on-disk file before saving, so
+    entries written meanwhile by another process (e.g. process-pool workers
+    handling other sequences in the same directory) are kept.
+
+    Returns the number of caches written.
+    """
+    with _SHARED_LOCK:
+        pending = [(d, _SHARED[d]) for d in _DIRTY if d in _SHARED]
+        _SHARED.clear()
+        _DIRTY.clear()
+
+    for dir_path, cache in pending:
+        _save_merged(dir_path, cache)
+
+    return len(pending)
+
+
+def flush_hashcache(dir_path: Path) -> bool:
+    """
+    Like flush_hashcaches(), for one directory whose work is done: write its
+    shared cache if dirty and forget it. Returns True if it was written.
+    """
+    key = Path(dir_path)
+    with _SHARED_LOCK:
+        cache = _SHARED.pop(key, None)
+        dirty = key in _DIRTY
+        _DIRTY.discard(key)
+
+    if cache is None or not dirty:
+        return False
+    _save_merged(key, cache)
+    return True
+
+
+def _save_merged(dir_path: Path, cache: Mapping[str, Any]) -> None:
+    merged = load_hashcache(dir_path)
+    merged.update(cache)
+    save_hashcache(dir_path, merged)
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import hashlib
+import mmap
+import os
+import threading
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import NamedTuple
 
 try:
     import blake3  # type: ignore
@@ -9,56 +16,491 @@ except Exception:
     blake3 = None
 
 
-def blake3_or_sha256_file(path: Path, chunk=4 * 1024 * 1024) -> str:
-    if blake3 is not None:
-        h = blake3.blake3()
-        with path.open("rb") as f:
-            for b in iter(lambda: f.read(chunk), b""):
-                h.update(b)
-        return "blake3:" + h.hexdigest()
+# Backend chosen once at import so the per-file path doesn't re-check it.
+if blake3 is not None:
+    _HASHER_NEW, _PREFIX = blake3.blake3, "blake3:"
+else:
     # Fallback
-    h = hashlib.sha256()
+    _HASHER_NEW, _PREFIX = hashlib.sha256, "sha256:"
+
+
+# Files at or above this size are memory-mapped and hashed by blake3 in one
+# update, so the whole buffer is visible to its SIMD tree hashing.
+MMAP_THRESHOLD = 1024 * 1024
+
+# Files at or above this size may additionally use blake3's internal threads.
+MULTITHREAD_THRESHOLD = 64 * 1024 * 1024
+
+# Without blake3, files at or above this size are mapped and passed to the
+# hasher in one update() call, which runs without the GIL and skips copying
+# each chunk into the read buffer.
+FALLBACK_MMAP_THRESHOLD = MMAP_THRESHOLD
+
+# Read size for files below the mmap thresholds, so one read covers them.
+# Buffers are capped at the file size, so small files don't pin a full chunk
+# per worker thread.
+READ_CHUNK = MMAP_THRESHOLD
+
+# Max threads blake3 may use for a single large file. Set from the CLI based on
+# how many crawl workers are running, so the two pools don't oversubscribe.
+G_HASH_THREADS: int = 1
+
+# When fewer large files are being hashed than workers (e.g. the tail of a
+# run), let each use its share of all cores rather than just G_HASH_THREADS.
+# Threads in one process can see each other; pool processes can't, so process
+# workers turn this off.
+G_SHARE_IDLE_CORES: bool = True
+
+_CPU_COUNT = os.cpu_count() or 1
+_LARGE_ACTIVE = 0
+_LARGE_LOCK = threading.Lock()
+
+
+# Sequences with at least this many frames are stat()ed concurrently.
+STAT_PARALLEL_MIN = 256
+
+# Sequential-access hints, where the platform has them.
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+_MADV_WILLNEED = getattr(mmap, "MADV_WILLNEED", None)
+_FADV_WILLNEED = getattr(os, "POSIX_FADV_WILLNEED", None)
+
+# Frames the hashcache can't answer and at least this big get a readahead
+# hint while the frame before them is hashed; smaller ones are a single read.
+READAHEAD_MIN = 1024 * 1024
+
+# Per-thread read buffer reused across files (see _read_buffer).
+_READ_BUFFERS = threading.local()
+
+
+class StatEntry(NamedTuple):
+    """A path with the size/mtime/inode captured from a single stat() call."""
+
+    path: Path
+    size: int
+    mtime: int
+    mtime_ns: int | None = None
+    ino: int | None = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+def _read_buffer(size: int) -> bytearray:
+    """Return this thread's reusable read buffer, grown to at least `size` bytes."""
+    buf = getattr(_READ_BUFFERS, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(size)
+        _READ_BUFFERS.buf = buf
+    return buf
+
+
+def hash_backend() -> str:
+    """Return the name of the content-hash backend in use ("blake3" or "sha256")."""
+    return _PREFIX[:-1]
+
+
+def set_hash_backend(name: str = "auto") -> str:
+    """
+    Select the content-hash backend: "auto", "blake3" or "sha256".
+
+    "auto" prefers blake3 when installed. Hashes carry their algorithm prefix,
+    so a tree crawled from hosts with and without blake3 would flip between
+    the two and look modified on every run; pin one backend there. Raises
+    RuntimeError if blake3 is requested but not installed.
+    """
+    global _HASHER_NEW, _PREFIX
+    if name == "auto":
+        name = "blake3" if blake3 is not None else "sha256"
+    if name == "blake3":
+        if blake3 is None:
+            raise RuntimeError("blake3 hashing requested but blake3 is not installed")
+        _HASHER_NEW, _PREFIX = blake3.blake3, "blake3:"
+    elif name == "sha256":
+        _HASHER_NEW, _PREFIX = hashlib.sha256, "sha256:"
+    else:
+        raise ValueError(f"Unknown hash backend: {name!r}")
+    return name
+
+
+def _blake3_mmap_threaded(path: Path) -> str:
+    """
+    Hash a large file with blake3's multithreaded mmap reader.
+
+    Thread count is G_HASH_THREADS, or with G_SHARE_IDLE_CORES an equal
+    share of the machine between the large files currently being hashed in
+    this process, whichever is more.
+    """
+    global _LARGE_ACTIVE
+    with _LARGE_LOCK:
+        _LARGE_ACTIVE += 1
+        threads = G_HASH_THREADS
+        if G_SHARE_IDLE_CORES:
+            threads = max(threads, _CPU_COUNT // _LARGE_ACTIVE)
+    try:
+        h = blake3.blake3(max_threads=max(threads, 1))
+        h.update_mmap(path)
+        return "blake3:" + h.hexdigest()
+    finally:
+        with _LARGE_LOCK:
+            _LARGE_ACTIVE -= 1
+
+
+def _update_from_mmap(h, path: Path, willneed: bool = False) -> bool:
+    """
+    Feed the whole of path to h from a read-only memory map.
+
+    Returns False, without touching h, if the file can't be mapped because
+    it is empty now (truncated since it was stat()ed); the caller then falls
+    back to reading it.
+    """
     with path.open("rb") as f:
-        for b in iter(lambda: f.read(chunk), b""):
-            h.update(b)
-    return "sha256:" + h.hexdigest()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return False
+        with mm:
+            if _MADV_SEQUENTIAL is not None:
+                # One front-to-back pass: aggressive readahead, early reclaim
+                mm.madvise(_MADV_SEQUENTIAL)
+            if willneed and _MADV_WILLNEED is not None:
+                mm.madvise(_MADV_WILLNEED)
+            h.update(mm)
+    return True
+
+
+def blake3_or_sha256_file(path: Path, chunk=READ_CHUNK, size: int | None = None) -> str:
+    if size is None:
+        size = path.stat().st_size
+    if _PREFIX == "blake3:" and size >= MMAP_THRESHOLD:
+        if size >= MULTITHREAD_THRESHOLD:
+            return _blake3_mmap_threaded(path)
+        # Mapped here rather than via update_mmap so the whole frame (at most
+        # MULTITHREAD_THRESHOLD) can be requested up front: one large
+        # readahead instead of the kernel growing its window fault by fault.
+        h = blake3.blake3()
+        if _update_from_mmap(h, path, willneed=True):
+            return "blake3:" + h.hexdigest()
+    elif size >= FALLBACK_MMAP_THRESHOLD:
+        h = _HASHER_NEW()
+        if _update_from_mmap(h, path):
+            return _PREFIX + h.hexdigest()
+    h = _HASHER_NEW()
+    # +1 so a file that fits in one read reaches EOF on the second readinto()
+    # without a second full-size read.
+    mv = memoryview(_read_buffer(min(chunk, size + 1)))[:chunk]
+    # Unbuffered: the buffer already covers the file, so skip BufferedReader's
+    # copy. readinto() fills the same buffer every time (looping only if the
+    # file grew since the stat); only the filled slice is hashed.
+    with path.open("rb", buffering=0) as f:
+        while n := f.readinto(mv):
+            h.update(mv[:n])
+    return _PREFIX + h.hexdigest()
+
+
+def get_stat_concurrency() -> int:
+    """
+    Return how many stat() calls a large sequence may have in flight at once.
+
+    Allows override via QC_STAT_CONCURRENCY; 0 or 1 disables concurrent stats.
+    """
+    try:
+        return int(os.environ.get("QC_STAT_CONCURRENCY", "32"))
+    except ValueError:
+        return 32
+
+
+_STAT_POOL: concurrent.futures.ThreadPoolExecutor | None = None
+_STAT_POOL_PID: int | None = None
+_STAT_POOL_LOCK = threading.Lock()
 
 
-def cheap_fingerprint(paths: list[Path]) -> dict[str, int]:
+def _stat_pool(workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide stat pool, recreating it after a fork."""
+    global _STAT_POOL, _STAT_POOL_PID
+    with _STAT_POOL_LOCK:
+        if _STAT_POOL is None or _STAT_POOL_PID != os.getpid():
+            _STAT_POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="qc-stat"
+            )
+            _STAT_POOL_PID = os.getpid()
+        return _STAT_POOL
+
+
+def get_frame_hash_workers() -> int:
+    """
+    Return how many frames of one sequence may be hashed at once.
+
+    Defaults to G_HASH_THREADS, this crawl worker's share of the cores: a full
+    worker pool already parallelises across sequences and keeps hashing
+    frames serially, while a crawl with cores to spare (few workers) also
+    fans out within a sequence. Allows override via QC_HASH_WORKERS; 0 or 1
+    hashes frames serially.
+    """
+    try:
+        return int(os.environ.get("QC_HASH_WORKERS", G_HASH_THREADS))
+    except ValueError:
+        return G_HASH_THREADS
+
+
+_FRAME_POOL: concurrent.futures.ThreadPoolExecutor | None = None
+_FRAME_POOL_PID: int | None = None
+_FRAME_POOL_LOCK = threading.Lock()
+
+
+def _frame_pool(workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    Return the process-wide frame hashing pool, recreating it after a fork.
+
+    Shared by every sequence in the process, so it is sized for the machine;
+    each sequence bounds its own frames in flight (see _hash_frames_concurrently).
+    """
+    global _FRAME_POOL, _FRAME_POOL_PID
+    with _FRAME_POOL_LOCK:
+        if _FRAME_POOL is None or _FRAME_POOL_PID != os.getpid():
+            _FRAME_POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(workers, _CPU_COUNT), thread_name_prefix="qc-frame"
+            )
+            _FRAME_POOL_PID = os.getpid()
+        return _FRAME_POOL
+
+
+def stat_entries(paths: Iterable[Path]) -> list[StatEntry]:
+    """
+    stat() each path once and return (path, size, mtime) entries.
+
+    The entries feed both cheap_fingerprint and manifest_hash_for_files so a
+    sequence costs one metadata round-trip per frame, which matters on a SAN.
+    Long sequences issue those round-trips concurrently (os.stat releases the
+    GIL), so latency-bound mounts aren't walked one RTT at a time.
+    """
+    paths = list(paths)
+    concurrency = get_stat_concurrency()
+    if concurrency > 1 and len(paths) >= STAT_PARALLEL_MIN:
+        results = _stat_pool(concurrency).map(os.stat, paths)
+    else:
+        results = map(os.stat, paths)
+    return [
+        StatEntry(p, st.st_size, int(st.st_mtime), st.st_mtime_ns, st.st_ino)
+        for p, st in zip(paths, results)
+    ]
+
+
+def _size_or_zero(path: Path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def file_sizes(paths: list[Path]) -> list[int]:
+    """
+    Return the size of each path, 0 for any that can't be stat'ed.
+
+    Stats are issued concurrently, as in stat_entries.
+    """
+    concurrency = get_stat_concurrency()
+    if concurrency > 1 and len(paths) >= STAT_PARALLEL_MIN:
+        return list(_stat_pool(concurrency).map(_size_or_zero, paths))
+    return [_size_or_zero(p) for p in paths]
+
+
+def cheap_fingerprint(entries: list[StatEntry]) -> dict[str, int]:
     total_files, total_bytes, newest_mtime = 0, 0, 0
-    for p in paths:
-        st = p.stat()
+    for e in entries:
         total_files += 1
-        total_bytes += int(st.st_size)
-        if int(st.st_mtime) > newest_mtime:
-            newest_mtime = int(st.st_mtime)
+        total_bytes += e.size
+        if e.mtime > newest_mtime:
+            newest_mtime = e.mtime
     return {"files": total_files, "bytes": total_bytes, "newest_mtime": newest_mtime}
 
 
-def content_hash_with_cache(p: Path, cache):
+def stat_fingerprint(st: os.stat_result) -> str:
+    """
+    Single-file counterpart of cheap_fingerprint: "size:mtime_ns:ino".
+
+    These are the fields _cache_entry_matches trusts for frames, so an
+    unchanged stat_fingerprint lets a single file skip its deep hash too.
+    """
+    return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+
+def _cache_entry_matches(entry, size, mtime, mtime_ns, ino) -> bool:
+    """
+    True if a hashcache entry still describes the file on disk.
+
+    Entries written before mtime_ns/ino were recorded only carry size/mtime;
+    those fields are compared when both sides have them, so a same-second
+    rewrite or a file swapped in via rename is no longer mistaken for a hit.
+    """
+    if not entry or "hash" not in entry:
+        return False
+    if entry.get("size") != size or entry.get("mtime") != mtime:
+        return False
+    cached_ns = entry.get("mtime_ns")
+    if cached_ns is not None and mtime_ns is not None and cached_ns != mtime_ns:
+        return False
+    cached_ino = entry.get("ino")
+    if cached_ino is not None and ino is not None and cached_ino != ino:
+        return False
+    return True
+
+
+def content_hash_with_cache(
+    p: Path,
+    cache,
+    size: int | None = None,
+    mtime: int | None = None,
+    mtime_ns: int | None = None,
+    ino: int | None = None,
+):
+    """
+    Return the content hash for p, reusing the cached value when the file's
+    (size, mtime, mtime_ns, inode) are unchanged.
+
+    Callers that already hold stat results can pass them to skip the stat().
+    """
     key = p.name
-    st = p.stat()
-    meta = {"size": int(st.st_size), "mtime": int(st.st_mtime)}
+    if size is None or mtime is None:
+        st = p.stat()
+        size, mtime = st.st_size, int(st.st_mtime)
+        mtime_ns, ino = st.st_mtime_ns, st.st_ino
     entry = cache.get(key)
-    if (
-        entry
-        and entry.get("size") == meta["size"]
-        and entry.get("mtime") == meta["mtime"]
-        and "hash" in entry
-    ):
+    if _cache_entry_matches(entry, size, mtime, mtime_ns, ino):
+        if mtime_ns is not None and "mtime_ns" not in entry:
+            # Upgrade a legacy entry in place so later runs get the full key
+            entry["mtime_ns"], entry["ino"] = mtime_ns, ino
         return entry["hash"]
-    h = blake3_or_sha256_file(p)
-    cache[key] = {"size": meta["size"], "mtime": meta["mtime"], "hash": h}
+    h = blake3_or_sha256_file(p, size=size)
+    cache[key] = {
+        "size": size,
+        "mtime": mtime,
+        "mtime_ns": mtime_ns,
+        "ino": ino,
+        "hash": h,
+    }
     return h
 
 
-def manifest_hash_for_files(files: list[Path], cache) -> str:
-    # Stable order
-    lines = []
-    for p in files:
-        st = p.stat()
-        fh = content_hash_with_cache(p, cache)
-        lines.append(f"{p.name}\0{st.st_size}\0{fh}\n")
-    joined = "".join(lines).encode("utf-8")
-    # Use blake2b for the joined manifest (fast, stable); content hashes are already blake3/sha256
-    return "blake2b:" + hashlib.blake2b(joined, digest_size=32).hexdigest()
+def _readahead(path: Path, size: int) -> None:
+    """Ask the kernel to start reading path into the page cache (best effort)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, min(size, MULTITHREAD_THRESHOLD), _FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _hash_frames_serially(
+    entries: list[StatEntry], cache, misses: list[int]
+) -> Iterator[str]:
+    """Yield each frame's hash in order, reading ahead to the next miss."""
+    # Overlap disk and hash: while one uncached frame is hashed, the kernel
+    # is already reading the next one.
+    ahead: list[StatEntry] = []
+    if _FADV_WILLNEED is not None:
+        ahead = [entries[i] for i in misses if entries[i].size >= READAHEAD_MIN]
+    next_ahead = 0
+
+    for e in entries:
+        if next_ahead < len(ahead) and e is ahead[next_ahead]:
+            next_ahead += 1
+            if next_ahead < len(ahead):
+                _readahead(ahead[next_ahead].path, ahead[next_ahead].size)
+        yield content_hash_with_cache(e.path, cache, e.size, e.mtime, e.mtime_ns, e.ino)
+
+
+def _hash_frames_concurrently(
+    entries: list[StatEntry], cache, misses: list[int], workers: int
+) -> Iterator[str]:
+    """
+    Yield each frame's hash in order, with up to `workers` cache misses being
+    hashed on the frame pool at once. Hits are answered inline; a pool round
+    trip costs more than a cache lookup.
+    """
+    pool = _frame_pool(workers)
+    todo = collections.deque(misses)
+    in_flight: dict[int, concurrent.futures.Future] = {}
+
+    def top_up() -> None:
+        while todo and len(in_flight) < workers:
+            i = todo.popleft()
+            e = entries[i]
+            # Each task writes only its own frame's cache key
+            in_flight[i] = pool.submit(
+                content_hash_with_cache,
+                e.path,
+                cache,
+                e.size,
+                e.mtime,
+                e.mtime_ns,
+                e.ino,
+            )
+
+    top_up()
+    for i, e in enumerate(entries):
+        fut = in_flight.pop(i, None)
+        if fut is None:
+            yield content_hash_with_cache(
+                e.path, cache, e.size, e.mtime, e.mtime_ns, e.ino
+            )
+        else:
+            fh = fut.result()
+            top_up()
+            yield fh
+
+
+def manifest_hash_for_files(
+    entries: list[StatEntry],
+    cache,
+    frame_hashes: dict[str, str] | None = None,
+    previous_hashes: dict[str, str] | None = None,
+) -> str:
+    """
+    Return the sequence manifest hash over (name, size, frame hash) lines.
+
+    Incremental: frame hashes come from the directory's hashcache, so a re-run
+    only reads frames whose stat key changed or that are new, i.e. O(new bytes)
+    when frames are appended to a sequence. Those frames are hashed
+    concurrently when get_frame_hash_workers() allows it; the manifest is the
+    same either way.
+
+    If `frame_hashes` is given, it is filled with {name: frame hash} as the
+    manifest is built; `previous_hashes` likewise gets the hash each frame had
+    in the cache beforehand (frames with none are left out).
+    """
+    if previous_hashes is not None:
+        for e in entries:
+            try:
+                previous_hashes[e.name] = cache[e.name]["hash"]
+            except (KeyError, TypeError):
+                pass
+
+    misses = [
+        i
+        for i, e in enumerate(entries)
+        if not _cache_entry_matches(
+            cache.get(e.name), e.size, e.mtime, e.mtime_ns, e.ino
+        )
+    ]
+    workers = get_frame_hash_workers()
+    if workers > 1 and len(misses) > 1:
+        hashes = _hash_frames_concurrently(entries, cache, misses, workers)
+    else:
+        hashes = _hash_frames_serially(entries, cache, misses)
+
+    # Stable order. Each manifest line is streamed straight into the digest
+    # instead of building the joined manifest; the result is identical.
+    # Use blake2b for the manifest (fast, stable); content hashes are already blake3/sha256
+    m = hashlib.blake2b(digest_size=32)
+    for e, fh in zip(entries, hashes):
+        name = e.name
+        m.update(f"{name}\0{e.size}\0{fh}\n".encode("utf-8"))
+        if frame_hashes is not None:
+            frame_hashes[name] = fh
+    return "blake2b:" + m.hexdigest()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+# Sidecars and hashcaches are small; one read of this size usually gets it all.
+READ_SIZE = 64 * 1024
+
+# orjson parses integers outside the int64/uint64 range as floats, losing
+# digits; every such literal has at least 19 digits. A run that long (which
+# may also sit in a string or a float, harmlessly) sends input to the stdlib.
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def read_file(path: os.PathLike | str) -> bytes:
+    """
+    Return the bytes of a small file with bare os.open/os.read/os.close.
+
+    Skips the FileIO/BufferedReader setup and size-probing fstat() of
+    Path.read_bytes(), which is most of the cost for a 1-2 KiB sidecar.
+    Raises the same OSErrors (FileNotFoundError etc.) as read_bytes().
+    """
+    fd = os.open(path, os.O_RDONLY | _O_CLOEXEC | _O_BINARY)
+    try:
+        data = os.read(fd, READ_SIZE)
+        if len(data) < READ_SIZE:
+            return data
+        chunks = [data]
+        while chunk := os.read(fd, READ_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def write_file(path: os.PathLike | str, data: bytes, *, fsync: bool = False) -> None:
+    """
+    Create/truncate path and write data to it (see read_file).
+
+    With fsync=True the data is flushed to storage before the file is closed;
+    a failing fsync (e.g. unsupported by the filesystem) is ignored.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_CLOEXEC | _O_BINARY
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        if fsync:
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+
+
+def _stdlib_dumps(data: Any, pretty: bool) -> bytes:
+    if pretty:
+        text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+    else:
+        text = json.dumps(
+            data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    return (text + "\n").encode("utf-8")
+
+
+def dumps(data: Any, *, pretty: bool = False) -> bytes:
+    """
+    Serialise data to UTF-8 JSON bytes with sorted keys and a trailing newline.
+
+    Uses orjson when available (C extension, emits bytes directly) and falls
+    back to the stdlib json module, also for data orjson rejects (integers
+    wider than 64 bits, e.g. a 20-digit frame number). Output is compact
+    unless pretty is True.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+
+    # Fallback
+    return _stdlib_dumps(data, pretty)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_line(data: Any) -> str:
+    """
+    Serialise data to a compact single-line JSON str (e.g. a log record).
+
+    Keys keep insertion order and datetimes serialise as ISO 8601 / RFC 3339,
+    natively under orjson and via isoformat() in the stdlib fallback (which
+    also takes data orjson rejects, as in dumps).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def loads(raw: bytes | str) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Integers wider than 64 bits come back exact (as with the stdlib), not as
+    the floats orjson would make of them. Raises ValueError
+    (json.JSONDecodeError or a subclass) on invalid input.
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS if isinstance(raw, str) else _LONG_DIGITS_BYTES
+        if long_digits.search(raw) is None:
+            return orjson.loads(raw)
+    return json.loads(raw)
@@ -70,20 +70,23 @@ def detect_sequence_mutation(
         Lists of changed/added/removed frames and a boolean flag indicating
         whether the sequence should be treated as mutated.
     """
-    prev = dict(previous_hashes or {})
-    curr = dict(current_hashes)
-
-    prev_keys = set(prev)
-    curr_keys = set(curr)
-
-    added = sorted(curr_keys - prev_keys)
-    removed = sorted(prev_keys - curr_keys)
-    common = prev_keys & curr_keys
-
-    changed = sorted(k for k in common if prev[k] != curr[k])
-
-    total_before = len(prev_keys)
-    total_after = len(curr_keys)
+    prev = previous_hashes or {}
+    curr = current_hashes
+
+    if prev == curr:
+        # Common nightly case: nothing moved. One C-level dict compare instead
+        # of building key sets for every frame.
+        added, removed, changed = [], [], []
+    else:
+        # Set algebra straight on the keys views; no copies of the mappings.
+        prev_keys = prev.keys()
+        curr_keys = curr.keys()
+        added = sorted(curr_keys - prev_keys)
+        removed = sorted(prev_keys - curr_keys)
+        changed = sorted(k for k in prev_keys & curr_keys if prev[k] != curr[k])
+
+    total_before = len(prev)
+    total_after = len(curr)
 
     # How many changes should be counted toward thresholds?
     threshold_changes = len(changed) + len(added)
@@ -11,9 +11,14 @@ from qc_asset_crawler import sidecar
 from qc_asset_crawler import config
 
 
+# Resolved once; both are consulted for every signature built.
+_UTC = timezone.utc
+_HAS_UUID7 = hasattr(uuid, "uuid7")  # py>=3.12
+
+
 def now_iso() -> str:
     """Return current UTC time as ISO-8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+    return datetime.now(_UTC).isoformat()
 
 
 def uuid7() -> str:
@@ -23,7 +28,7 @@ def uuid7() -> str:
     Use uuid.uuid7() when available (py>=3.12), otherwise fall back to a
     ULID-like construction based on current milliseconds + random bytes.
     """
-    if hasattr(uuid, "uuid7"):
+    if _HAS_UUID7:
         return str(uuid.uuid7())  # py>=3.12
 
     # Fallback: time-ordered-ish UUID
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import os
-import re
 from pathlib import Path
 from collections.abc import Iterable
+from typing import Any
+
+# NumPy is only used for long sequences (see _count_ranges_and_holes) and is
+# the single most expensive import in the package, so it is loaded on first
+# use rather than on every CLI start-up. None means "not installed".
+_UNLOADED = object()
+np: Any = _UNLOADED
+
+
+def _numpy():
+    """Return the numpy module (importing it once), or None if unavailable."""
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy  # type: ignore
+        except Exception:
+            numpy = None
+        np = numpy
+    return np
+
 
 # Media handling
 MEDIA_EXTS = {
@@ -23,10 +44,38 @@ MEDIA_EXTS = {
 
 SEQ_EXTS = {".exr", ".dpx", ".tif", ".tiff", ".jpg", ".png"}
 
-# filename pattern:
-#   base + frame + "." + ext
-# e.g. conjuring-last-rites_tlr-f1_dcin_las.087469.tif
-_seq_re = re.compile(r"^(?P<base>.*?)(?P<frame>\d+)(?P<dot>\.)(?P<ext>[^.]+)$")
+# SEQ_EXTS without the leading dot, for matching parse_frame_name()'s ext
+_SEQ_EXT_NAMES = frozenset(e[1:] for e in SEQ_EXTS)
+
+_DIGITS = "0123456789"
+
+# Sequences at least this long use the NumPy range/hole scan when available.
+NUMPY_MIN_FRAMES = 512
+
+
+def parse_frame_name(name: str) -> tuple[str, str, str] | None:
+    """
+    Split a frame filename into (base, frame, ext), or None if it isn't one.
+
+    filename pattern:
+      base + frame + "." + ext
+    e.g. conjuring-last-rites_tlr-f1_dcin_las.087469.tif
+
+    The frame is the run of ASCII digits immediately before the final dot and
+    base may be empty (e.g. "0001.dpx"). Done with str.rfind/rstrip, which is
+    several times cheaper than the regex this replaced when called for every
+    file in a large tree. Unlike that regex's \\d, only ASCII digits count as
+    frame digits: a name numbered with other Unicode digits (Arabic-Indic,
+    full-width, ...) is not a frame.
+    """
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return None
+    stem = name[:dot]
+    base = stem.rstrip(_DIGITS)
+    if len(base) == dot:
+        return None
+    return base, stem[len(base) :], name[dot + 1 :]
 
 
 def is_sequence_candidate(p: Path) -> bool:
@@ -34,20 +83,89 @@ def is_sequence_candidate(p: Path) -> bool:
     return p.suffix.lower() in SEQ_EXTS
 
 
+def get_walk_concurrency() -> int:
+    """
+    Return how many directories iter_media may list at once.
+
+    Allows override via QC_WALK_CONCURRENCY; 0 or 1 walks serially.
+    """
+    try:
+        return int(os.environ.get("QC_WALK_CONCURRENCY", "8"))
+    except ValueError:
+        return 8
+
+
+def _scan_dir(dirpath: str) -> tuple[list[str], list[str]]:
+    """
+    List one directory: return (media file paths, subdirectory paths).
+
+    File/dir classification comes from the directory entry type (d_type), so
+    this costs no per-file stat() on filesystems that report it. Symlinked
+    directories are not followed, matching os.walk's default; a symlink is
+    only stat'ed when its name has a media extension, to tell a linked file
+    from a linked directory.
+    """
+    media: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                name = entry.name
+                # skip hidden directories and files
+                if name[0] == ".":
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    subdirs.append(entry.path)
+                    continue
+                if os.path.splitext(name)[1].lower() not in MEDIA_EXTS:
+                    continue
+                if entry.is_symlink():
+                    try:
+                        if entry.is_dir():
+                            continue
+                    except OSError:
+                        pass
+                media.append(entry.path)
+    except OSError:
+        # Unreadable/vanished directory: skip it, as os.walk does
+        pass
+    return media, subdirs
+
+
 def iter_media(root: Path) -> Iterable[Path]:
     """
     Walk root recursively, yielding files that look like media
     based on extension, skipping hidden dirs/files.
+
+    Each directory is one os.scandir() (see _scan_dir). On a SAN the walk is
+    bound by per-directory round-trip latency rather than CPU, so up to
+    get_walk_concurrency() directories are listed at once; results are still
+    yielded in a deterministic (breadth-first) order.
     """
-    for dirpath, dirnames, filenames in os.walk(root):
-        # skip hidden directories
-        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        for f in filenames:
-            if f.startswith("."):
-                continue
-            p = Path(dirpath) / f
-            if p.suffix.lower() in MEDIA_EXTS:
-                yield p
+    concurrency = get_walk_concurrency()
+    if concurrency <= 1:
+        # Depth-first, visiting subdirectories in listing order
+        stack = [os.fspath(root)]
+        while stack:
+            media, subdirs = _scan_dir(stack.pop())
+            for path in media:
+                yield Path(path)
+            stack.extend(reversed(subdirs))
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="qc-walk"
+    ) as ex:
+        pending = collections.deque([ex.submit(_scan_dir, os.fspath(root))])
+        while pending:
+            media, subdirs = pending.popleft().result()
+            pending.extend(ex.submit(_scan_dir, d) for d in subdirs)
+            for path in media:
+                yield Path(path)
 
 
 def seq_key(p: Path):
@@ -55,10 +173,11 @@ def seq_key(p: Path):
     Grouping key for sequences:
     (parent directory, base, extension) or None if not a frame.
     """
-    m = _seq_re.match(p.name)
-    if not m:
+    parsed = parse_frame_name(p.name)
+    if not parsed:
         return None
-    return (p.parent, m.group("base"), m.group("ext"))
+    base, _frame, ext = parsed
+    return (p.parent, base, ext)
 
 
 def group_sequences(files: Iterable[Path], min_seq: int = 3):
@@ -73,25 +192,79 @@ def group_sequences(files: Iterable[Path], min_seq: int = 3):
     groups: dict[tuple[Path, str, str], list[Path]] = {}
     singles: list[Path] = []
 
-    # First pass: try to group all sequence-capable files
-    for p in files:
-        if is_sequence_candidate(p):
-            k = seq_key(p)
-            if k:
-                groups.setdefault(k, []).append(p)
-                continue
-        singles.append(p)
+    # One shared parent Path per directory string. Building p.parent for
+    # every frame, and hashing each fresh Path as part of the dict key, was
+    # the bulk of grouping time on large trees.
+    parents: dict[str, Path] = {}
+    sep = os.sep
 
-    # Keep only groups with >= min_seq frames
-    sequences = {k: sorted(v) for k, v in groups.items() if len(v) >= min_seq}
-    seq_members = {p for vs in sequences.values() for p in vs}
+    # First pass: try to group all sequence-capable files. The name is parsed
+    # once and its ext doubles as the candidate check (same as
+    # is_sequence_candidate + seq_key, without recomputing Path.suffix).
+    for p in files:
+        s = str(p)
+        cut = s.rfind(sep)
+        parsed = parse_frame_name(s[cut + 1 :])
+        if parsed and parsed[2].lower() in _SEQ_EXT_NAMES:
+            d = s[:cut]
+            parent = parents.get(d)
+            if parent is None:
+                parent = parents[d] = p.parent
+            base, _frame, ext = parsed
+            groups.setdefault((parent, base, ext), []).append(p)
+        else:
+            singles.append(p)
 
-    # Any file not in a sequence (or already in singles) is a single
-    singles.extend([p for p in files if p not in seq_members and p not in singles])
+    # Keep only groups with >= min_seq frames; members of shorter groups are
+    # singles. Every file lands in exactly one bucket above, so no second pass
+    # over `files` is needed (which also lets `files` be a one-shot iterator).
+    sequences: dict[tuple[Path, str, str], list[Path]] = {}
+    for k, v in groups.items():
+        if len(v) >= min_seq:
+            # Same order as sorting the Paths (members share a parent, and
+            # pathlib compares normcased parts), without a Path.__lt__ call
+            # per comparison.
+            sequences[k] = sorted(v, key=os.path.normcase)
+        else:
+            singles.extend(v)
 
     return sequences, singles
 
 
+def _count_ranges_and_holes(frames: list[int]) -> tuple[int, int]:
+    """
+    Count contiguous ranges and missing frames in a sorted frame list.
+
+    Any step other than +1 starts a new range and adds (step - 1) holes.
+    """
+    if len(frames) >= NUMPY_MIN_FRAMES and _numpy() is not None:
+        try:
+            arr = np.fromiter(frames, dtype=np.int64, count=len(frames))
+        except OverflowError:
+            # Frame numbers beyond int64; use the pure-Python scan
+            arr = None
+        if arr is not None:
+            steps = np.diff(arr)
+            breaks = steps[steps != 1]
+            return int(breaks.size) + 1, int((breaks - 1).sum())
+
+    ranges = 0
+    holes = 0
+    prev = frames[0]
+
+    for f in frames[1:]:
+        if f == prev + 1:
+            prev = f
+        else:
+            ranges += 1
+            holes += f - prev - 1
+            prev = f
+
+    ranges += 1  # last range
+
+    return ranges, holes
+
+
 def summarize_frames(file_names: list[str]) -> dict[str, int] | None:
     """
     Summarise frame range, holes, and padding from a list of filenames
@@ -101,10 +274,10 @@ def summarize_frames(file_names: list[str]) -> dict[str, int] | None:
     pad: int | None = None
 
     for n in file_names:
-        m = _seq_re.match(n)
-        if not m:
+        parsed = parse_frame_name(n)
+        if not parsed:
             continue
-        s = m.group("frame")
+        s = parsed[1]
         frames.append(int(s))
         pad = pad or len(s)
 
@@ -114,19 +287,7 @@ def summarize_frames(file_names: list[str]) -> dict[str, int] | None:
     frames.sort()
     pad = pad or 0
 
-    ranges = 0
-    holes = 0
-    prev = frames[0]
-
-    for f in frames[1:]:
-        if f == prev + 1:
-            prev = f
-        else:
-            ranges += 1
-            holes += f - prev - 1
-            prev = f
-
-    ranges += 1  # last range
+    ranges, holes = _count_ranges_and_holes(frames)
 
     return {
         "frame_min": frames[0],
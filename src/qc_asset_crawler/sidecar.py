@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 import logging
+import stat
 import sys
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from qc_asset_crawler import jsonio
+
+
+# Set from CLI (--pretty): indent sidecars for human inspection.
+G_PRETTY_SIDECARS: bool = False
+
+# Sidecar parent directories already created/seen by this process. Every
+# sidecar in a directory shares one parent (e.g. ".qc"), so only the first
+# write there needs the mkdir + stat round-trip.
+_KNOWN_DIRS: set[Path] = set()
+
 
 # ---------------- Schema metadata & migrations ---------------- #
 
@@ -49,6 +61,8 @@ V1_OPTIONAL_FIELDS = {
     # add or remove as appropriate
 }
 
+V1_ALLOWED_FIELDS = frozenset(V1_REQUIRED_FIELDS | V1_OPTIONAL_FIELDS)
+
 
 def validate_v1_sidecar(data: dict[str, Any], *, strict: bool = False) -> None:
     """
@@ -56,9 +70,11 @@ def validate_v1_sidecar(data: dict[str, Any], *, strict: bool = False) -> None:
 
     Raises ValueError if required fields are missing or types look wrong.
     """
-    missing = [field for field in V1_REQUIRED_FIELDS if field not in data]
+    missing = V1_REQUIRED_FIELDS - data.keys()
     if missing:
-        raise ValueError(f"v1 sidecar missing required fields: {', '.join(missing)}")
+        raise ValueError(
+            f"v1 sidecar missing required fields: {', '.join(sorted(missing))}"
+        )
 
     if data.get("schema_name") != SCHEMA_NAME:
         logging.warning(
@@ -82,11 +98,10 @@ def validate_v1_sidecar(data: dict[str, Any], *, strict: bool = False) -> None:
         raise ValueError("v1 sidecar 'asset_id' must be string, int or null")
 
     if strict:
-        allowed_fields = V1_REQUIRED_FIELDS | V1_OPTIONAL_FIELDS
-        extra = [field for field in data.keys() if field not in allowed_fields]
+        extra = data.keys() - V1_ALLOWED_FIELDS
         if extra:
             logging.warning(
-                "v1 sidecar has unexpected extra fields: %s", ", ".join(extra)
+                "v1 sidecar has unexpected extra fields: %s", ", ".join(sorted(extra))
             )
 
 
@@ -138,15 +153,23 @@ def _coerce_schema_version(value: Any) -> int:
     return 1
 
 
+# Sidecar naming and policy version are read from the environment once per
+# process, on first use, as in config.py. Call <getter>.cache_clear() after
+# changing the environment.
+
+
+@functools.lru_cache(maxsize=1)
 def get_side_suffix_file() -> str:
     return os.environ.get("QC_SIDE_SUFFIX_FILE", ".qc.json")
 
 
+@functools.lru_cache(maxsize=1)
 def get_side_name_sequence() -> str:
     # Default to "sequence.qc.json" to match current sequence sidecar naming
     return os.environ.get("QC_SIDE_NAME_SEQUENCE", "sequence.qc.json")
 
 
+@functools.lru_cache(maxsize=1)
 def get_qc_policy_version() -> str:
     return os.environ.get("QC_POLICY_VERSION", "2025.11.0")
 
@@ -300,9 +323,10 @@ def set_hidden_attribute(path: Path) -> None:
 
             ctypes.windll.kernel32.SetFileAttributesW(str(path), 0x02)
         elif sys.platform == "darwin":
-            import subprocess
-
-            subprocess.run(["chflags", "hidden", str(path)], check=False)
+            # chflags(2) in-process: as `chflags hidden`, without a
+            # fork/exec per sidecar write
+            flags = getattr(os.lstat(path), "st_flags", 0)
+            os.chflags(path, flags | stat.UF_HIDDEN)
     except Exception:
         # Best-effort; failure to hide the file is not fatal
         logging.debug("Failed to set hidden attribute for %s", path)
@@ -317,7 +341,7 @@ def read_sidecar(path: Path) -> dict[str, Any] | None:
     - Ensures schema_name/schema_version fields are present and normalised.
     """
     try:
-        raw = path.read_text(encoding="utf-8")
+        raw = jsonio.read_file(path)
     except FileNotFoundError:
         # Normal case: no sidecar yet for this asset/sequence
         return None
@@ -327,7 +351,7 @@ def read_sidecar(path: Path) -> dict[str, Any] | None:
         return None
 
     try:
-        data: dict[str, Any] = json.loads(raw)
+        data: dict[str, Any] = jsonio.loads(raw)
     except ValueError as e:
         logging.warning("Invalid JSON in sidecar %s: %s", path, e)
         return None
@@ -344,18 +368,34 @@ def read_sidecar(path: Path) -> dict[str, Any] | None:
 def write_sidecar(path: Path, data: dict[str, Any]) -> None:
     """
     Write a sidecar JSON file atomically, ensuring schema metadata is present.
+
+    If the file already holds exactly these bytes it is left untouched (no
+    temp file, rename or attribute update).
     """
     # Attach/update schema_name + schema_version
     payload = ensure_schema_metadata(data)
+    raw = jsonio.dumps(payload, pretty=G_PRETTY_SIDECARS)
+
+    try:
+        if jsonio.read_file(path) == raw:
+            return
+    except OSError:
+        # Usually FileNotFoundError: a new sidecar
+        pass
 
-    path.parent.mkdir(parents=True, exist_ok=True)
+    parent = path.parent
+    if parent not in _KNOWN_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(parent)
 
     # Write to a temporary file first for atomic replace
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, indent=2, sort_keys=True),
-        encoding="utf-8",
-    )
+    try:
+        jsonio.write_file(tmp, raw)
+    except FileNotFoundError:
+        # Directory removed since we cached it (e.g. qc_cleanup mid-run)
+        parent.mkdir(parents=True, exist_ok=True)
+        jsonio.write_file(tmp, raw)
 
     # Atomic replace
     os.replace(tmp, path)
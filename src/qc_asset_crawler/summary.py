@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import sys
 from collections import Counter, defaultdict
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 
+from qc_asset_crawler import jsonio
+
 
 STATUS_ICONS: Mapping[str, str] = {
     "pass": "✅",
@@ -20,6 +22,32 @@ def get_status(data: dict) -> str:
     return (data.get("qc_result") or "pending").lower()
 
 
+def _walk_sidecars(root: Path) -> list[Path]:
+    """
+    Return every '*.qc.json' under root, as rglob would, but from one
+    os.scandir walk with a plain endswith test per name (no fnmatch).
+    Symlinked directories are not descended into.
+    """
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.name.endswith(".qc.json"):
+                        found.append(Path(entry.path))
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            # Unreadable/vanished directory: skip it
+            continue
+    return found
+
+
 def find_sidecars(paths: Sequence[str]) -> list[Path]:
     """Yield sidecar paths from the given paths (files or dirs).
 
@@ -41,8 +69,7 @@ def find_sidecars(paths: Sequence[str]) -> list[Path]:
                     file=sys.stderr,
                 )
         elif path.is_dir():
-            for sidecar in path.rglob("*.qc.json"):
-                found.append(sidecar)
+            found.extend(_walk_sidecars(path))
         else:
             print(f"[WARN] Not found or unsupported path: {raw}", file=sys.stderr)
 
@@ -52,14 +79,14 @@ def find_sidecars(paths: Sequence[str]) -> list[Path]:
 
 def load_json(path: Path) -> dict | None:
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = jsonio.read_file(path)
     except OSError as exc:
         print(f"[ERROR] Failed to read {path}: {exc}", file=sys.stderr)
         return None
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
+        return jsonio.loads(raw)
+    except ValueError as exc:
         print(f"[ERROR] Failed to parse JSON {path}: {exc}", file=sys.stderr)
         return None
 
@@ -2,9 +2,38 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive connection pool shared by all workers in a process. Size it above
+# typical --workers so threads don't queue for a socket.
+POOL_MAXSIZE = 64
+
+# Set from CLI (--workers). The pool grows to at least this many sockets;
+# otherwise threads beyond POOL_MAXSIZE open a fresh connection (and TLS
+# handshake) per request and urllib3 discards it afterwards.
+G_WORKERS: int = 1
+
+# Batched asset-search: max paths per request, and how long the batcher waits
+# for more concurrent lookups before sending a partial batch.
+LOOKUP_BATCH_SIZE = 100
+LOOKUP_BATCH_LINGER = 0.02
+
+# Successful path lookups remembered per process. Every sequence in a
+# directory looks up that same directory path, so most repeats are free.
+LOOKUP_CACHE_SIZE = 4096
+
+# Threads posting QC results in the background while crawl workers move on to
+# the next hash (see start_qc_poster).
+QC_POST_THREADS = 4
 
 
 def get_trak_base_url() -> str:
@@ -15,22 +44,89 @@ def get_trak_api_key() -> str:
     return os.environ.get("TRAK_ASSET_TRACKER_API_KEY", None)
 
 
+def get_trak_batch_lookup() -> bool:
+    """
+    Return True if path lookups should be coalesced into batched asset-search
+    requests (TRAK_BATCH_LOOKUP=1). Off by default; only enable it against a
+    Trak instance that accepts `assetPaths` and echoes `assetPath` per item.
+    """
+    value = os.environ.get("TRAK_BATCH_LOOKUP", "")
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def headers_json() -> dict[str, str]:
+    """
+    Return the default Trak request headers.
+
+    Applied once as session defaults (see _session), not rebuilt per call.
+    Deliberately not captured at import time, so the API key can come from
+    the environment (or .env) of whoever imports this module first.
+    """
     header = {
         "content-type": "application/json",
         "cache-control": "no-cache",
         "accept": "text/plain",
     }
-    if get_trak_api_key():
-        header["x-api-key"] = get_trak_api_key()
+    api_key = get_trak_api_key()
+    if api_key:
+        header["x-api-key"] = api_key
     return header
 
 
+_SESSION: requests.Session | None = None
+_SESSION_PID: int | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """
+    Return the process-wide Trak session, creating it on first use (and again
+    after a fork, since pooled sockets must not be shared across processes).
+
+    The session carries the JSON/API-key headers as defaults and retries
+    connection failures and, for idempotent methods, 502/503/504 responses.
+    urllib3 does not retry POST on status codes, so a QC post is never
+    submitted twice.
+    """
+    global _SESSION, _SESSION_PID
+    with _SESSION_LOCK:
+        if _SESSION is None or _SESSION_PID != os.getpid():
+            s = requests.Session()
+            s.headers.update(headers_json())
+            adapter = HTTPAdapter(
+                pool_maxsize=max(POOL_MAXSIZE, G_WORKERS),
+                max_retries=Retry(
+                    total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+                ),
+            )
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _SESSION = s
+            _SESSION_PID = os.getpid()
+        return _SESSION
+
+
+def reset_session() -> None:
+    """Drop the cached session, e.g. after changing TRAK_* environment settings."""
+    global _SESSION, _SESSION_PID
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION = None
+        _SESSION_PID = None
+
+
+def _log_response(r) -> None:
+    """Log a response body at DEBUG without decoding it when DEBUG is off."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("%s", r.text)
+
+
 def tracker_app_version():
     url = f"{get_trak_base_url()}/server-info/app-version"
     try:
-        r = requests.get(url, headers=headers_json(), timeout=15)
-        logging.debug(r.text)
+        r = _session().get(url, timeout=15)
+        _log_response(r)
         if not r.ok:
             status = "unauthorized" if r.status_code in (401, 403) else "error"
             return {
@@ -55,7 +151,7 @@ def tracker_app_version():
         }
 
 
-def tracker_lookup_asset_by_path(path: Path) -> dict:
+def _lookup_single(path: Path) -> dict:
     url = f"{get_trak_base_url()}/asset/asset-search"
     body = {
         "searchPage": {"pageSize": 100},
@@ -65,8 +161,8 @@ def tracker_lookup_asset_by_path(path: Path) -> dict:
         "tagIds": [],
     }
     try:
-        r = requests.post(url, json=body, headers=headers_json(), timeout=15)
-        logging.debug(r.text)
+        r = _session().post(url, json=body, timeout=15)
+        _log_response(r)
         if not r.ok:
             status = "unauthorized" if r.status_code in (401, 403) else "error"
             return {"asset_id": None, "status": status, "http_code": r.status_code}
@@ -79,12 +175,263 @@ def tracker_lookup_asset_by_path(path: Path) -> dict:
         return {"asset_id": None, "status": "error", "http_code": None}
 
 
+def tracker_lookup_assets_by_paths(paths: list[Path]) -> dict[Path, dict] | None:
+    """
+    Look up several asset paths with one batched asset-search request.
+
+    Returns {path: lookup_result} in the same shape as
+    tracker_lookup_asset_by_path, or None if the server doesn't accept the
+    batched form (400/404/405/501). Items are matched back to paths via their
+    `assetPath`; paths with no matching item get asset_id None.
+    """
+    url = f"{get_trak_base_url()}/asset/asset-search"
+    body = {
+        "searchPage": {"pageSize": max(len(paths), 1)},
+        "assetSearchType": 2,
+        "includeCustomer": False,
+        "assetPaths": [p.as_posix() for p in paths],
+        "tagIds": [],
+    }
+    try:
+        r = _session().post(url, json=body, timeout=15)
+        _log_response(r)
+        if r.status_code in (400, 404, 405, 501):
+            return None
+        if not r.ok:
+            status = "unauthorized" if r.status_code in (401, 403) else "error"
+            failed = {"asset_id": None, "status": status, "http_code": r.status_code}
+            return {p: dict(failed) for p in paths}
+        data = r.json()
+    except requests.RequestException:
+        return {
+            p: {"asset_id": None, "status": "error", "http_code": None} for p in paths
+        }
+
+    found: dict[str, str] = {}
+    for item in data.get("items") or []:
+        item_path = item.get("assetPath") or item.get("asset_path")
+        if item_path and item.get("asset_id"):
+            found.setdefault(item_path, item["asset_id"])
+
+    return {
+        p: {"asset_id": found.get(p.as_posix()), "status": "ok", "http_code": 200}
+        for p in paths
+    }
+
+
+class TrackerBatcher:
+    """
+    Coalesce concurrent path lookups from crawl workers into batched requests.
+
+    Workers block in lookup(); a daemon thread drains the queue, waiting up to
+    `linger` seconds to fill a batch of at most `batch_size` paths. If the
+    server rejects the batched form, the batcher falls back to one request per
+    path for the rest of the process.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = LOOKUP_BATCH_SIZE,
+        linger: float = LOOKUP_BATCH_LINGER,
+    ) -> None:
+        self._queue: queue.Queue[tuple[Path, Future]] = queue.Queue()
+        self._batch_size = max(batch_size, 1)
+        self._linger = linger
+        self._batch_supported = True
+        self._thread = threading.Thread(
+            target=self._run, name="trak-lookup-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def lookup(self, path: Path) -> dict:
+        fut: Future = Future()
+        self._queue.put((path, fut))
+        return fut.result()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._linger
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[Path, Future]]) -> None:
+        try:
+            results = None
+            if self._batch_supported:
+                # The same path can be queued twice; ask for it once
+                paths = list(dict.fromkeys(p for p, _ in batch))
+                results = tracker_lookup_assets_by_paths(paths)
+                if results is None:
+                    logging.info(
+                        "Trak batched asset-search not supported; "
+                        "falling back to per-path lookups"
+                    )
+                    self._batch_supported = False
+            for path, fut in batch:
+                fut.set_result(
+                    results[path] if results is not None else _lookup_single(path)
+                )
+        except Exception as e:  # pragma: no cover - defensive
+            for _path, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+
+
+_BATCHER: TrackerBatcher | None = None
+_BATCHER_PID: int | None = None
+_BATCHER_LOCK = threading.Lock()
+
+
+def _get_batcher() -> TrackerBatcher:
+    """Return the process-wide batcher, (re)starting it after a fork."""
+    global _BATCHER, _BATCHER_PID
+    with _BATCHER_LOCK:
+        if _BATCHER is None or _BATCHER_PID != os.getpid():
+            _BATCHER = TrackerBatcher()
+            _BATCHER_PID = os.getpid()
+        return _BATCHER
+
+
+_LOOKUP_CACHE: OrderedDict[tuple[str, str], dict] = OrderedDict()
+# Lookups being made right now, so concurrent callers for the same path
+# (sequences of one directory on different workers) share one request.
+_LOOKUP_INFLIGHT: dict[tuple[str, str], Future] = {}
+_LOOKUP_CACHE_LOCK = threading.Lock()
+
+
+def clear_lookup_cache() -> None:
+    """Forget remembered path lookups (e.g. between tests)."""
+    with _LOOKUP_CACHE_LOCK:
+        _LOOKUP_CACHE.clear()
+
+
+def tracker_lookup_asset_by_path(path: Path) -> dict:
+    """
+    Look up the Trak asset for a path.
+
+    Successful answers are remembered (LRU, LOOKUP_CACHE_SIZE entries);
+    failures are not, so a transient error is retried on the next asset.
+    A caller asking for a path that another thread is already looking up
+    waits for that answer instead of sending its own request.
+    """
+    key = (get_trak_base_url(), path.as_posix())
+    with _LOOKUP_CACHE_LOCK:
+        cached = _LOOKUP_CACHE.get(key)
+        if cached is not None:
+            _LOOKUP_CACHE.move_to_end(key)
+            return dict(cached)
+        inflight = _LOOKUP_INFLIGHT.get(key)
+        if inflight is None:
+            fut: Future = Future()
+            _LOOKUP_INFLIGHT[key] = fut
+
+    if inflight is not None:
+        return dict(inflight.result())
+
+    try:
+        if get_trak_batch_lookup():
+            result = _get_batcher().lookup(path)
+        else:
+            result = _lookup_single(path)
+    except BaseException as e:
+        with _LOOKUP_CACHE_LOCK:
+            del _LOOKUP_INFLIGHT[key]
+        fut.set_exception(e)
+        raise
+
+    with _LOOKUP_CACHE_LOCK:
+        del _LOOKUP_INFLIGHT[key]
+        if result.get("status") == "ok":
+            _LOOKUP_CACHE[key] = dict(result)
+            if len(_LOOKUP_CACHE) > LOOKUP_CACHE_SIZE:
+                _LOOKUP_CACHE.popitem(last=False)
+    fut.set_result(dict(result))
+    return result
+
+
 def tracker_set_qc(asset_id: str | None, payload: dict) -> bool:
     if not asset_id or payload.get("qc_result") == "pending":
         return False
     url = f"{get_trak_base_url()}/assets/{asset_id}/qc"
     try:
-        r = requests.post(url, json=payload, headers=headers_json(), timeout=15)
+        r = _session().post(url, json=payload, timeout=15)
         return bool(r.ok)
     except requests.RequestException:
         return False
+
+
+_QC_POSTER: ThreadPoolExecutor | None = None
+_QC_POSTER_PID: int | None = None
+_QC_PENDING: set[Future] = set()
+_QC_LOCK = threading.Lock()
+
+
+def start_qc_poster(threads: int = QC_POST_THREADS) -> None:
+    """
+    Send subsequent post_qc() calls from a small background thread pool.
+
+    Crawl workers then return to hashing instead of waiting on Trak. Pending
+    posts are drained by flush_qc_posts() / stop_qc_poster().
+    """
+    global _QC_POSTER, _QC_POSTER_PID
+    with _QC_LOCK:
+        if _QC_POSTER is None or _QC_POSTER_PID != os.getpid():
+            _QC_PENDING.clear()
+            _QC_POSTER = ThreadPoolExecutor(
+                max_workers=max(threads, 1), thread_name_prefix="trak-qc-post"
+            )
+            _QC_POSTER_PID = os.getpid()
+
+
+def _qc_post_done(fut: Future) -> None:
+    with _QC_LOCK:
+        _QC_PENDING.discard(fut)
+    if fut.exception() is not None:
+        logging.error("Trak QC post failed: %s", fut.exception())
+
+
+def post_qc(asset_id: str | None, payload: dict) -> None:
+    """
+    Post a QC result via tracker_set_qc, in the background if a poster is
+    running in this process, otherwise inline.
+    """
+    with _QC_LOCK:
+        poster = _QC_POSTER if _QC_POSTER_PID == os.getpid() else None
+        if poster is not None:
+            fut = poster.submit(tracker_set_qc, asset_id, payload)
+            _QC_PENDING.add(fut)
+    if poster is None:
+        tracker_set_qc(asset_id, payload)
+        return
+    fut.add_done_callback(_qc_post_done)
+
+
+def flush_qc_posts() -> None:
+    """Block until every QC post queued so far has completed."""
+    with _QC_LOCK:
+        pending = list(_QC_PENDING)
+    for fut in pending:
+        try:
+            fut.result()
+        except Exception:
+            pass  # logged by _qc_post_done
+
+
+def stop_qc_poster() -> None:
+    """Drain pending QC posts and go back to posting inline."""
+    global _QC_POSTER, _QC_POSTER_PID
+    with _QC_LOCK:
+        poster = _QC_POSTER if _QC_POSTER_PID == os.getpid() else None
+        _QC_POSTER = None
+        _QC_POSTER_PID = None
+    if poster is not None:
+        poster.shutdown(wait=True)
+    flush_qc_posts()
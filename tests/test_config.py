@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from qc_asset_crawler import config
+
+
+def test_getters_read_environment_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("QC_XATTR_KEY", "user.test.qc")
+    monkeypatch.setenv("TOOL_VERSION", "test-tool/9.9.9")
+    config.get_xattr_key.cache_clear()
+    config.get_tool_version.cache_clear()
+    try:
+        assert config.get_xattr_key() == "user.test.qc"
+        assert config.get_tool_version() == "test-tool/9.9.9"
+
+        # Cached until explicitly cleared
+        monkeypatch.setenv("QC_XATTR_KEY", "user.other.qc")
+        assert config.get_xattr_key() == "user.test.qc"
+        config.get_xattr_key.cache_clear()
+        assert config.get_xattr_key() == "user.other.qc"
+    finally:
+        config.get_xattr_key.cache_clear()
+        config.get_tool_version.cache_clear()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 
 import pytest
@@ -156,7 +158,11 @@ def test_run_processes_sequences_and_singles(
     monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
 
     # We don't care whether mark_missing_content is called or not in this test.
-    monkeypatch.setattr(crawler, "mark_missing_content", lambda root_arg: 0)
+    monkeypatch.setattr(
+        crawler,
+        "mark_missing_content",
+        lambda root_arg, dir_contents=None, workers=1: 0,
+    )
 
     # Ensure we're in nightly/autonomous mode
     crawler.G_FORCED_RESULT = None
@@ -191,3 +197,769 @@ def test_run_processes_sequences_and_singles(
     # And sidecars should have some content_state set ('new' or 'modified')
     for sc_path, sidecar_sig in written_sidecars.items():
         assert sidecar_sig.get("content_state") in {"new", "modified"}
+
+
+def test_init_worker_restores_cli_globals(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Process-pool workers don't share the parent's module globals, so the
+    initializer must restore everything the CLI sets.
+    """
+    from qc_asset_crawler import crawler
+
+    monkeypatch.setattr(crawler, "G_SIDECAR_MODE", "dot")
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", "pass")
+    monkeypatch.setattr(crawler, "G_NOTE", "looks good")
+    monkeypatch.setattr(crawler.sidecar, "G_SIDECAR_MODE", "dot", raising=False)
+    monkeypatch.setattr(crawler.hashing, "G_HASH_THREADS", 3)
+    monkeypatch.setattr(crawler.hashing, "_HASHER_NEW", crawler.hashing._HASHER_NEW)
+    monkeypatch.setattr(crawler.hashing, "_PREFIX", crawler.hashing._PREFIX)
+    crawler.hashing.set_hash_backend("sha256")
+
+    settings = crawler._worker_settings()
+    crawler.hashing.set_hash_backend("auto")
+
+    monkeypatch.setattr(crawler, "G_SIDECAR_MODE", "subdir")
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+    monkeypatch.setattr(crawler, "G_NOTE", None)
+    monkeypatch.setattr(crawler.sidecar, "G_SIDECAR_MODE", "inline")
+    monkeypatch.setattr(crawler.hashing, "G_HASH_THREADS", 1)
+
+    crawler._init_worker(settings)
+
+    assert crawler.G_SIDECAR_MODE == "dot"
+    assert crawler.G_FORCED_RESULT == "pass"
+    assert crawler.G_NOTE == "looks good"
+    assert crawler.sidecar.G_SIDECAR_MODE == "dot"
+    assert crawler.hashing.G_HASH_THREADS == 3
+    assert crawler.hashing.hash_backend() == "sha256"
+
+
+def test_worker_cpus_are_disjoint_per_slot() -> None:
+    from qc_asset_crawler import crawler
+
+    allowed = [0, 1, 2, 3, 4, 5]
+    assert crawler._worker_cpus(0, allowed, 2) == {0, 1}
+    assert crawler._worker_cpus(1, allowed, 2) == {2, 3}
+    assert crawler._worker_cpus(2, allowed, 2) == {4, 5}
+    # Wraps rather than running off the end, and never asks for more CPUs
+    # than are allowed
+    assert crawler._worker_cpus(3, allowed, 2) == {0, 1}
+    assert crawler._worker_cpus(0, [2, 7], 4) == {2, 7}
+
+
+def test_pin_worker_takes_next_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    import multiprocessing
+
+    from qc_asset_crawler import crawler
+
+    pinned = []
+    monkeypatch.setattr(
+        crawler.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False
+    )
+    monkeypatch.setattr(
+        crawler.os,
+        "sched_setaffinity",
+        lambda pid, cpus: pinned.append(set(cpus)),
+        raising=False,
+    )
+
+    slots = multiprocessing.Value("i", 0)
+    crawler._pin_worker(slots, 2)
+    crawler._pin_worker(slots, 2)
+
+    assert pinned == [{0, 1}, {2, 3}]
+    assert slots.value == 2
+
+
+def test_cpu_slot_counter_skips_oversubscribed_pools(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from qc_asset_crawler import crawler
+
+    monkeypatch.setattr(
+        crawler.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False
+    )
+    monkeypatch.setattr(
+        crawler.os, "sched_setaffinity", lambda pid, cpus: None, raising=False
+    )
+
+    assert crawler._cpu_slot_counter(4) is None
+    assert crawler._cpu_slot_counter(2).value == 0
+
+
+def test_cpu_slot_counter_honours_pin_opt_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from qc_asset_crawler import crawler
+
+    monkeypatch.setattr(
+        crawler.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False
+    )
+    monkeypatch.setattr(
+        crawler.os, "sched_setaffinity", lambda pid, cpus: None, raising=False
+    )
+
+    monkeypatch.setenv("QC_PIN_WORKERS", "0")
+    assert crawler._cpu_slot_counter(2) is None
+    monkeypatch.setenv("QC_PIN_WORKERS", "1")
+    assert crawler._cpu_slot_counter(2) is not None
+
+
+def test_process_singles_batch_isolates_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from qc_asset_crawler import crawler
+
+    def fake_single(p: Path, operator: str, asset_id=None):
+        if p.name == "bad.mov":
+            raise RuntimeError("boom")
+        return ("marked", p)
+
+    monkeypatch.setattr(crawler, "process_single_file", fake_single)
+
+    paths = [Path("a.mov"), Path("bad.mov"), Path("c.mov")]
+    out = crawler._process_singles_batch(paths, "op", None)
+
+    assert out == [
+        ("marked", Path("a.mov")),
+        ("error", Path("bad.mov")),
+        ("marked", Path("c.mov")),
+    ]
+
+
+def test_batch_size_targets_four_batches_per_worker() -> None:
+    from qc_asset_crawler import crawler
+
+    assert crawler._batch_size(0, 8) == 1
+    assert crawler._batch_size(10, 8) == 1
+    assert crawler._batch_size(1000, 8) == 31
+    assert crawler._batch_size(1000, 0) == 250
+
+
+def test_interleaved_batches_share_out_large_items() -> None:
+    from qc_asset_crawler import crawler
+
+    batches = crawler._interleaved_batches(list(range(10, 0, -1)), 3)
+
+    assert batches == [[10, 6, 2], [9, 5, 1], [8, 4], [7, 3]]
+    assert crawler._interleaved_batches([], 3) == []
+
+
+def test_run_submits_longest_sequences_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    # One directory, so all three are queued before any can be picked
+    files = []
+    for base, count in (("short", 3), ("long", 9), ("mid", 5)):
+        files += [tmp_path / "shot" / f"{base}.{i:04d}.exr" for i in range(count)]
+
+    started: list[str] = []
+
+    def fake_sequence(dir_path, base, ext, members, operator, asset_id=None):
+        started.append(base.rstrip("."))
+        return ("skip", dir_path)
+
+    monkeypatch.setattr(crawler, "iter_media", lambda root: files)
+    monkeypatch.setattr(crawler, "process_sequence", fake_sequence)
+    monkeypatch.setattr(
+        crawler, "mark_missing_content", lambda root, dir_contents=None, workers=1: 0
+    )
+
+    crawler.run(tmp_path, operator="op", workers=1, min_seq=3)
+
+    assert started == ["long", "mid", "short"]
+
+
+def test_run_starts_hashing_while_walking(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    first_started = threading.Event()
+    started: list[str] = []
+
+    def walk(root):
+        yield tmp_path / "a" / "one.mov"
+        # Moving on to b/ completes a/; the rest of the tree only appears
+        # once a worker is busy with it
+        yield tmp_path / "b" / "small.mov"
+        assert first_started.wait(5)
+        yield tmp_path / "c" / "plate.0001.exr"
+        yield tmp_path / "c" / "plate.0002.exr"
+        yield tmp_path / "c" / "plate.0003.exr"
+
+    def fake_single(p, operator, asset_id=None):
+        started.append(p.name)
+        first_started.set()
+        return ("marked", p)
+
+    def fake_sequence(dir_path, base, ext, members, operator, asset_id=None):
+        started.append(base.rstrip("."))
+        return ("marked", dir_path)
+
+    monkeypatch.setattr(crawler, "iter_media", walk)
+    monkeypatch.setattr(crawler, "process_single_file", fake_single)
+    monkeypatch.setattr(crawler, "process_sequence", fake_sequence)
+    monkeypatch.setattr(
+        crawler, "mark_missing_content", lambda root, dir_contents=None, workers=1: 0
+    )
+
+    assert crawler.run(tmp_path, operator="op", workers=1, min_seq=3) == 0
+
+    assert started[0] == "one.mov"
+    assert sorted(started) == ["one.mov", "plate", "small.mov"]
+
+
+def test_run_drains_qc_poster_when_the_walk_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    calls: list[str] = []
+
+    def walk(root):
+        yield tmp_path / "a" / "one.mov"
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(crawler, "iter_media", walk)
+    monkeypatch.setattr(
+        crawler, "process_single_file", lambda p, operator, asset_id=None: ("marked", p)
+    )
+    monkeypatch.setattr(
+        crawler.trak_client, "start_qc_poster", lambda: calls.append("start")
+    )
+    monkeypatch.setattr(
+        crawler.trak_client, "stop_qc_poster", lambda: calls.append("stop")
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        crawler.run(tmp_path, operator="op", workers=1, min_seq=3)
+
+    assert calls == ["start", "stop"]
+
+
+def test_run_idle_worker_takes_late_big_sequence_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    first_started = threading.Event()
+    all_queued = threading.Event()
+
+    def walk(root):
+        yield tmp_path / "a" / "one.mov"
+        yield tmp_path / "b" / "small.mov"
+        assert first_started.wait(5)
+        for i in range(3):
+            yield tmp_path / "c" / f"plate.{i:04d}.exr"
+
+    started: list[str] = []
+
+    real_queue = crawler._queue_directory
+    queued_dirs = []
+
+    def queue_directory(jobs, order, dir_files, *args):
+        out = real_queue(jobs, order, dir_files, *args)
+        queued_dirs.append(dir_files[0].parent.name)
+        if len(queued_dirs) == 3:
+            all_queued.set()
+        return out
+
+    def fake_single(p, operator, asset_id=None):
+        started.append(p.name)
+        first_started.set()
+        # Busy until c/ has been queued behind b/
+        assert all_queued.wait(5)
+        return ("marked", p)
+
+    def fake_sequence(dir_path, base, ext, members, operator, asset_id=None):
+        started.append(base.rstrip("."))
+        return ("marked", dir_path)
+
+    monkeypatch.setattr(crawler, "iter_media", walk)
+    monkeypatch.setattr(crawler, "_queue_directory", queue_directory)
+    monkeypatch.setattr(crawler, "process_single_file", fake_single)
+    monkeypatch.setattr(crawler, "process_sequence", fake_sequence)
+    monkeypatch.setattr(
+        crawler, "mark_missing_content", lambda root, dir_contents=None, workers=1: 0
+    )
+
+    assert crawler.run(tmp_path, operator="op", workers=1, min_seq=3) == 0
+
+    # The sequence arrived last but there is one queue for every worker, so
+    # it isn't stuck behind b/'s single
+    assert started == ["one.mov", "plate", "small.mov"]
+
+
+def test_run_writes_each_directory_hashcache_when_its_sequences_finish(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler, hashcache
+
+    # a/ has two sequences (its hashcache is shared), b/ a shorter one
+    for name, count in (("a/fg", 5), ("a/bg", 4), ("b/plate", 3)):
+        for i in range(count):
+            f = tmp_path / f"{name}.{1001 + i}.exr"
+            f.parent.mkdir(exist_ok=True)
+            f.write_bytes(name.encode() + bytes([i]))
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+
+    on_disk_at_b: list[set] = []
+    real_sequence = crawler.process_sequence
+
+    def recording(dir_path, *args):
+        if dir_path.name == "b":
+            on_disk_at_b.append(set(hashcache.load_hashcache(tmp_path / "a")))
+        return real_sequence(dir_path, *args)
+
+    monkeypatch.setattr(crawler, "process_sequence", recording)
+    # a/ is walked (and so queued) first
+    real_walk = crawler.iter_media
+    monkeypatch.setattr(crawler, "iter_media", lambda root: sorted(real_walk(root)))
+
+    assert crawler.run(tmp_path, operator="op", workers=1, min_seq=3) == 0
+
+    assert len(on_disk_at_b) == 1
+    assert len(on_disk_at_b[0]) == 9
+    assert len(hashcache.load_hashcache(tmp_path / "b")) == 3
+
+
+def test_iter_dir_groups_splits_on_parent_change(tmp_path: Path) -> None:
+    from qc_asset_crawler import crawler
+
+    files = [tmp_path / "a" / "1.mov", tmp_path / "a" / "2.mov", tmp_path / "b.mov"]
+
+    assert list(crawler._iter_dir_groups(files)) == [files[:2], files[2:]]
+    assert list(crawler._iter_dir_groups([])) == []
+
+
+def test_iter_sidecars_finds_all_patterns_in_one_walk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    monkeypatch.setenv("QC_SIDE_NAME_SEQUENCE", "qc.sequence.json")
+    crawler.sidecar.get_side_name_sequence.cache_clear()
+    expected = [
+        tmp_path / "a.mov.qc.json",
+        tmp_path / "shot" / ".b.mov.qc.json",
+        tmp_path / "shot" / ".qc" / "c.exr.qc.json",
+        tmp_path / "shot" / "qc.sequence.json",
+        tmp_path / "shot" / "deep" / ".qc.sequence.json",
+        tmp_path / "shot" / "deep" / ".qc" / "qc.sequence.json",
+    ]
+    for p in expected:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("{}", encoding="utf-8")
+    (tmp_path / "shot" / "notes.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "shot" / "c.exr").write_bytes(b"x")
+
+    try:
+        found = list(crawler._iter_sidecars_under_root(tmp_path))
+    finally:
+        crawler.sidecar.get_side_name_sequence.cache_clear()
+
+    assert sorted(found) == sorted(expected)
+    assert len(found) == len(set(found))
+
+
+def test_sequence_media_exists_uses_crawl_listing(tmp_path: Path) -> None:
+    from qc_asset_crawler import crawler
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    (shot / "plate.1001.exr").write_bytes(b"x")
+    listing = crawler._media_by_dir([shot / "plate.1001.exr"])
+    seq_info = {"base": "plate", "ext": "exr"}
+
+    assert crawler._sequence_media_exists(shot, seq_info, listing)
+
+    # The listing is authoritative for directories the crawl walked...
+    (shot / "plate.1001.exr").unlink()
+    assert crawler._sequence_media_exists(shot, seq_info, listing)
+    assert not crawler._sequence_media_exists(
+        shot, {"base": "bg", "ext": "exr"}, listing
+    )
+
+    # ...and the directory is listed again for anything it can't answer
+    (shot / "plate.1002.exr").write_bytes(b"x")
+    assert crawler._sequence_media_exists(shot, seq_info, {})
+    (shot / "plate.1002.raw").write_bytes(b"x")
+    assert crawler._sequence_media_exists(
+        shot, {"base": "plate", "ext": "raw"}, listing
+    )
+
+
+def test_process_sequence_feeds_mutation_check_from_manifest_pass(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler, hashcache
+    from qc_asset_crawler.mutation import SequenceMutationConfig
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    frames = []
+    for i in range(1001, 1004):
+        f = shot / f"plate.{i}.exr"
+        f.write_bytes(bytes([i % 256]) * 16)
+        frames.append(f)
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+
+    seen: list[tuple[dict, dict]] = []
+    real_detect = crawler.detect_sequence_mutation
+
+    def recording(previous_hashes, current_hashes, config):
+        seen.append((dict(previous_hashes), dict(current_hashes)))
+        return real_detect(previous_hashes, current_hashes, config)
+
+    monkeypatch.setattr(crawler, "detect_sequence_mutation", recording)
+    monkeypatch.setattr(
+        crawler,
+        "G_MUTATION_CONFIG",
+        SequenceMutationConfig(
+            threshold_frames=1,
+            threshold_percent=None,
+            count_removed_frames=False,
+            treat_added_frames_as_mutation=True,
+        ),
+    )
+    # An operator sign-off, then an unattended re-check after one frame changed
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", "pass")
+    status, _ = crawler.process_sequence(shot, "plate", "exr", frames, "op", None)
+    assert status == "marked"
+
+    frames[1].write_bytes(b"regraded" * 4)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+    status, _ = crawler.process_sequence(shot, "plate", "exr", frames, "op", None)
+    assert status == "marked"
+    hashcache.flush_hashcaches()
+
+    (prev0, curr0), (prev1, curr1) = seen
+    assert prev0 == {}
+    assert sorted(curr0) == [f.name for f in frames]
+    assert prev1 == curr0
+    assert {n for n in curr1 if curr1[n] != prev1[n]} == {frames[1].name}
+
+
+def test_process_single_file_skips_hash_when_stat_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    clip = tmp_path / "clip.mov"
+    clip.write_bytes(b"frame data")
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+
+    hashed: list[Path] = []
+    real_hash = crawler.hashing.blake3_or_sha256_file
+
+    def counting_hash(path):
+        hashed.append(path)
+        return real_hash(path)
+
+    monkeypatch.setattr(crawler.hashing, "blake3_or_sha256_file", counting_hash)
+
+    assert crawler.process_single_file(clip, "op")[0] == "marked"
+    assert crawler.process_single_file(clip, "op")[0] == "skip"
+    assert hashed == [clip]
+
+    # A touch moves mtime_ns: rehash, same content, so skip and record the
+    # new stat_fp for the next run
+    st = clip.stat()
+    os.utime(clip, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert crawler.process_single_file(clip, "op")[0] == "skip"
+    assert crawler.process_single_file(clip, "op")[0] == "skip"
+    assert hashed == [clip, clip]
+
+    sc = crawler.sidecar.read_sidecar(crawler.sidecar.sidecar_path_for_file(clip))
+    assert sc["stat_fp"] == crawler.hashing.stat_fingerprint(clip.stat())
+
+
+def test_process_sequence_skip_only_backfills_missing_cheap_fp(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler, hashcache
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    frames = []
+    for i in range(1001, 1004):
+        f = shot / f"plate.{i}.exr"
+        f.write_bytes(bytes([i % 256]) * 16)
+        frames.append(f)
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+
+    writes: list[Path] = []
+    real_write = crawler.sidecar.write_sidecar
+
+    def counting_write(path, data):
+        writes.append(path)
+        return real_write(path, data)
+
+    monkeypatch.setattr(crawler.sidecar, "write_sidecar", counting_write)
+
+    assert crawler.process_sequence(shot, "plate.", "exr", frames, "op")[0] == "marked"
+    sc = writes[-1]
+
+    # A touched frame changes cheap_fp but not the content: no rewrite
+    st = frames[0].stat()
+    os.utime(frames[0], ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    writes.clear()
+    assert crawler.process_sequence(shot, "plate.", "exr", frames, "op")[0] == "skip"
+    assert writes == []
+
+    # A sidecar without one gets it backfilled, once
+    data = crawler.sidecar.read_sidecar(sc)
+    del data["sequence"]["cheap_fp"]
+    real_write(sc, data)
+    for _ in range(2):
+        status, _ = crawler.process_sequence(shot, "plate.", "exr", frames, "op")
+        assert status == "skip"
+    assert writes == [sc]
+    assert crawler.sidecar.read_sidecar(sc)["sequence"]["cheap_fp"]
+    hashcache.flush_hashcaches()
+
+
+def test_process_sequence_reads_its_sidecar_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler, hashcache
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    frames = []
+    for i in range(1001, 1004):
+        f = shot / f"plate.{i}.exr"
+        f.write_bytes(b"x" * 8)
+        frames.append(f)
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", "pass")
+
+    reads: list[Path] = []
+    real_read = crawler.sidecar.read_sidecar
+
+    def counting_read(sc: Path):
+        reads.append(sc)
+        return real_read(sc)
+
+    monkeypatch.setattr(crawler.sidecar, "read_sidecar", counting_read)
+
+    for _ in range(2):
+        status, _ = crawler.process_sequence(shot, "plate", "exr", frames, "op", None)
+        assert status == "marked"
+    hashcache.flush_hashcaches()
+
+    assert len(reads) == 2
+
+
+def test_sequence_media_exists_scans_directory_entries(tmp_path: Path) -> None:
+    from qc_asset_crawler import crawler
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    seq_info = {"base": "plate", "ext": "exr"}
+
+    assert not crawler._sequence_media_exists(tmp_path / "gone", seq_info)
+    assert not crawler._sequence_media_exists(shot, seq_info)
+
+    # Directories and other sequences don't count
+    (shot / "plate.1001.exr").mkdir()
+    (shot / "bg.1001.exr").write_bytes(b"x")
+    (shot / "plate.1001.dpx").write_bytes(b"x")
+    assert not crawler._sequence_media_exists(shot, seq_info)
+
+    (shot / "plate.1002.EXR").write_bytes(b"x")
+    assert crawler._sequence_media_exists(shot, seq_info)
+    assert crawler._sequence_media_exists(shot, {"base": "", "ext": ""})
+
+
+def test_run_submits_largest_singles_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    files = []
+    for name, size in (("small.mov", 10), ("big.mov", 1000), ("mid.mov", 100)):
+        p = tmp_path / name
+        p.write_bytes(b"x" * size)
+        files.append(p)
+    files.append(tmp_path / "vanished.mov")
+
+    started: list[str] = []
+
+    def fake_single(p, operator, asset_id=None):
+        started.append(p.name)
+        return ("skip", p)
+
+    monkeypatch.setattr(crawler, "iter_media", lambda root: files)
+    monkeypatch.setattr(crawler, "process_single_file", fake_single)
+    monkeypatch.setattr(
+        crawler, "mark_missing_content", lambda root, dir_contents=None, workers=1: 0
+    )
+
+    crawler.run(tmp_path, operator="op", workers=1, min_seq=3)
+
+    assert started == ["big.mov", "mid.mov", "small.mov", "vanished.mov"]
+
+
+def test_mark_missing_content_resolves_only_non_canonical_paths(
+    tmp_path: Path, make_sidecar, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    root = tmp_path.resolve() / "show"
+    kept = root / "kept.mov"
+    kept.parent.mkdir()
+    kept.write_bytes(b"x")
+    make_sidecar(root / "kept.mov.qc.json", asset_path=str(kept))
+    make_sidecar(root / "gone.mov.qc.json", asset_path=str(root / "gone.mov"))
+    make_sidecar(root / "rel.mov.qc.json", asset_path="sub/../rel.mov")
+    make_sidecar(root / "out.mov.qc.json", asset_path=str(tmp_path / "out.mov"))
+
+    resolved: list[Path] = []
+    real_resolve = Path.resolve
+
+    def counting_resolve(self, *args, **kwargs):
+        resolved.append(self)
+        return real_resolve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "resolve", counting_resolve)
+
+    assert crawler.mark_missing_content(root) == 2
+
+    # The crawl root, the relative path and the out-of-root one
+    assert len(resolved) == 3
+    states = {
+        name: crawler.sidecar.read_sidecar(root / f"{name}.qc.json").get(
+            "content_state"
+        )
+        for name in ("kept.mov", "gone.mov", "rel.mov", "out.mov")
+    }
+    assert states == {
+        "kept.mov": None,
+        "gone.mov": "missing",
+        "rel.mov": "missing",
+        "out.mov": None,
+    }
+
+
+def test_mark_missing_content_parallel_matches_serial(
+    tmp_path: Path, make_sidecar
+) -> None:
+    from qc_asset_crawler import crawler
+
+    root = tmp_path.resolve()
+    for i in range(8):
+        media = root / f"d{i % 3}" / f"clip{i}.mov"
+        media.parent.mkdir(exist_ok=True)
+        if i % 2:
+            media.write_bytes(b"x")
+        make_sidecar(media.parent / f"{media.name}.qc.json", asset_path=str(media))
+
+    assert crawler.mark_missing_content(root, workers=4) == 4
+    # Already-marked sidecars aren't rewritten
+    assert crawler.mark_missing_content(root, workers=1) == 0
+
+
+def test_set_xattr_uses_platform_setter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(crawler, "_SETXATTR", lambda *args: calls.append(args))
+    crawler.set_xattr(tmp_path / "a.mov", "QC-1")
+    key = os.fsencode(crawler.config.get_xattr_key())
+    assert calls == [(str(tmp_path / "a.mov"), key, b"QC-1")]
+
+    # Best-effort: failures and unsupported platforms are silent
+    def failing(*args):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(crawler, "_SETXATTR", failing)
+    crawler.set_xattr(tmp_path / "a.mov", "QC-1")
+    monkeypatch.setattr(crawler, "_SETXATTR", None)
+    crawler.set_xattr(tmp_path / "a.mov", "QC-1")
+
+
+def test_process_sequence_stats_each_frame_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from qc_asset_crawler import crawler, hashcache
+
+    shot = tmp_path / "shot"
+    shot.mkdir()
+    frames = []
+    for i in range(1001, 1006):
+        f = shot / f"plate.{i}.exr"
+        f.write_bytes(b"x" * 8)
+        frames.append(f)
+
+    monkeypatch.setattr(
+        crawler.trak_client,
+        "tracker_lookup_asset_by_path",
+        lambda path: {"status": "ok", "http_code": 200, "asset_id": "ASSET-1"},
+    )
+    monkeypatch.setattr(crawler.trak_client, "tracker_set_qc", lambda a, s: True)
+    monkeypatch.setattr(crawler, "set_xattr", lambda path, value: None)
+    monkeypatch.setattr(crawler, "G_FORCED_RESULT", None)
+
+    frame_paths = {os.fspath(f) for f in frames}
+    stats: list[str] = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path) in frame_paths:
+            stats.append(os.fspath(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+
+    # First run hashes every frame, the second is all hashcache hits; either
+    # way the cheap fingerprint and manifest share one stat per frame.
+    for expected in ("marked", "skip"):
+        stats.clear()
+        status, _ = crawler.process_sequence(shot, "plate", "exr", frames, "op", None)
+        assert status == expected
+        assert sorted(stats) == sorted(frame_paths)
+    hashcache.flush_hashcaches()
@@ -85,3 +85,53 @@ def test_load_hashcache_ignores_extra_fields(tmp_path: Path) -> None:
     assert isinstance(cache, dict)
     assert cache["somefile.dpx"] == "blake3:abcd"
     assert cache["junk_field"] == ["unexpected", 123]
+
+
+def test_shared_hashcache_is_shared_and_flushed_once(tmp_path: Path) -> None:
+    """
+    Sequences in the same directory must share one cache dict, and flushing
+    must merge over entries another writer saved in the meantime.
+    """
+    from qc_asset_crawler import hashcache
+
+    save_hashcache(tmp_path, {"old.exr": {"hash": "h0"}})
+
+    left = hashcache.shared_hashcache(tmp_path)
+    right = hashcache.shared_hashcache(tmp_path)
+    assert left is right
+    assert left["old.exr"] == {"hash": "h0"}
+
+    left["left.0001.exr"] = {"hash": "h1"}
+    right["right.0001.exr"] = {"hash": "h2"}
+    hashcache.mark_hashcache_dirty(tmp_path)
+
+    # Another process writes to the same directory cache before we flush
+    save_hashcache(tmp_path, {"old.exr": {"hash": "h0"}, "other.exr": {"hash": "h3"}})
+
+    assert hashcache.flush_hashcaches() == 1
+
+    data = load_hashcache(tmp_path)
+    assert set(data) == {"old.exr", "other.exr", "left.0001.exr", "right.0001.exr"}
+
+    # Flushed caches are forgotten; nothing left to write
+    assert hashcache.flush_hashcaches() == 0
+    assert hashcache.shared_hashcache(tmp_path) is not left
+
+
+def test_flush_hashcache_writes_one_finished_directory(tmp_path: Path) -> None:
+    from qc_asset_crawler import hashcache
+
+    done, busy = tmp_path / "done", tmp_path / "busy"
+    hashcache.shared_hashcache(done)["a.0001.exr"] = {"hash": "h1"}
+    hashcache.shared_hashcache(busy)["b.0001.exr"] = {"hash": "h2"}
+    hashcache.mark_hashcache_dirty(done)
+    hashcache.mark_hashcache_dirty(busy)
+
+    assert hashcache.flush_hashcache(done)
+    assert load_hashcache(done) == {"a.0001.exr": {"hash": "h1"}}
+    assert load_hashcache(busy) == {}
+    # Already written and forgotten
+    assert not hashcache.flush_hashcache(done)
+
+    assert hashcache.flush_hashcaches() == 1
+    assert load_hashcache(busy) == {"b.0001.exr": {"hash": "h2"}}
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from qc_asset_crawler import hashing
+
+
+def test_small_and_large_files_hash_the_same_way(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    The mmap path used for large files must produce the same digest as the
+    incremental read path, so thresholds can change without invalidating caches.
+    """
+    p = tmp_path / "clip.mov"
+    p.write_bytes(b"x" * 4096)
+
+    streamed = hashing.blake3_or_sha256_file(p)
+
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+    mapped = hashing.blake3_or_sha256_file(p)
+
+    monkeypatch.setattr(hashing, "MULTITHREAD_THRESHOLD", 1)
+    monkeypatch.setattr(hashing, "G_HASH_THREADS", 4)
+    threaded = hashing.blake3_or_sha256_file(p)
+
+    assert streamed == mapped == threaded
+
+
+def test_sha256_fallback_when_blake3_missing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    p = tmp_path / "clip.mov"
+    p.write_bytes(b"hello")
+
+    monkeypatch.setattr(hashing, "blake3", None)
+    monkeypatch.setattr(hashing, "_HASHER_NEW", hashlib.sha256)
+    monkeypatch.setattr(hashing, "_PREFIX", "sha256:")
+
+    assert hashing.blake3_or_sha256_file(p) == (
+        "sha256:" + hashlib.sha256(b"hello").hexdigest()
+    )
+
+
+def test_manifest_hash_matches_joined_manifest(tmp_path: Path) -> None:
+    """
+    Streaming the manifest must give the same digest as hashing the joined
+    manifest text, so existing sequence sidecars don't all look modified.
+    """
+    files = []
+    for i in range(1, 4):
+        f = tmp_path / f"shot.{i:04d}.exr"
+        f.write_bytes(b"frame" * i)
+        files.append(f)
+
+    cache: dict = {}
+    got = hashing.manifest_hash_for_files(hashing.stat_entries(files), cache)
+
+    joined = "".join(
+        f"{p.name}\0{p.stat().st_size}\0{cache[p.name]['hash']}\n" for p in files
+    ).encode("utf-8")
+    expected = "blake2b:" + hashlib.blake2b(joined, digest_size=32).hexdigest()
+
+    assert got == expected
+
+
+def test_cheap_fingerprint_from_stat_entries(tmp_path: Path) -> None:
+    a = tmp_path / "a.0001.exr"
+    b = tmp_path / "a.0002.exr"
+    a.write_bytes(b"12")
+    b.write_bytes(b"345")
+
+    entries = hashing.stat_entries([a, b])
+    fp = hashing.cheap_fingerprint(entries)
+
+    assert [e.path for e in entries] == [a, b]
+    assert [e.size for e in entries] == [2, 3]
+    assert fp["files"] == 2
+    assert fp["bytes"] == 5
+    assert fp["newest_mtime"] == max(e.mtime for e in entries)
+
+
+def test_stat_fingerprint_tracks_size_mtime_and_inode(tmp_path: Path) -> None:
+    a = tmp_path / "a.mov"
+    a.write_bytes(b"12")
+    st = a.stat()
+
+    assert hashing.stat_fingerprint(st) == f"2:{st.st_mtime_ns}:{st.st_ino}"
+
+    # Same size and mtime, but swapped in via rename
+    b = tmp_path / "b.mov"
+    b.write_bytes(b"34")
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns))
+    b.replace(a)
+    assert hashing.stat_fingerprint(a.stat()) != hashing.stat_fingerprint(st)
+
+
+def test_partial_final_chunk_is_not_padded(tmp_path: Path) -> None:
+    """Only the bytes actually read may be hashed when the buffer is reused."""
+    big = tmp_path / "a.mov"
+    small = tmp_path / "b.mov"
+    big.write_bytes(b"A" * 100)
+    small.write_bytes(b"B" * 30)
+
+    # Hash the larger file first so the shared buffer holds stale bytes
+    hashing.blake3_or_sha256_file(big, chunk=64)
+    got = hashing.blake3_or_sha256_file(small, chunk=64)
+
+    assert got == hashing.blake3_or_sha256_file(small)
+    assert got == hashing._PREFIX + hashing._HASHER_NEW(b"B" * 30).hexdigest()
+
+
+def test_sha256_fallback_mmap_matches_streaming(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    p = tmp_path / "clip.mxf"
+    p.write_bytes(b"0123456789" * 1000)
+
+    monkeypatch.setattr(hashing, "blake3", None)
+    monkeypatch.setattr(hashing, "_HASHER_NEW", hashlib.sha256)
+    monkeypatch.setattr(hashing, "_PREFIX", "sha256:")
+
+    streamed = hashing.blake3_or_sha256_file(p)
+    monkeypatch.setattr(hashing, "FALLBACK_MMAP_THRESHOLD", 1)
+    mapped = hashing.blake3_or_sha256_file(p)
+
+    assert streamed == mapped == "sha256:" + hashlib.sha256(p.read_bytes()).hexdigest()
+
+
+def test_stat_entries_concurrent_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = []
+    for i in range(20):
+        f = tmp_path / f"shot.{i:04d}.exr"
+        f.write_bytes(b"x" * i)
+        files.append(f)
+
+    monkeypatch.setenv("QC_STAT_CONCURRENCY", "1")
+    serial = hashing.stat_entries(files)
+
+    monkeypatch.setenv("QC_STAT_CONCURRENCY", "4")
+    monkeypatch.setattr(hashing, "STAT_PARALLEL_MIN", 1)
+    concurrent = hashing.stat_entries(iter(files))
+
+    assert concurrent == serial
+    assert [e.size for e in concurrent] == list(range(20))
+
+
+def test_hashcache_entry_rejects_same_second_rewrite(tmp_path: Path) -> None:
+    f = tmp_path / "shot.0001.exr"
+    f.write_bytes(b"aaaa")
+    cache: dict = {}
+    first = hashing.content_hash_with_cache(f, cache)
+    assert cache[f.name]["ino"] == f.stat().st_ino
+
+    # Same size and same whole-second mtime, different bytes
+    st = f.stat()
+    f.write_bytes(b"bbbb")
+    new_ns = int(st.st_mtime) * 10**9 + (1 if st.st_mtime_ns % 10**9 != 1 else 2)
+    os.utime(f, ns=(st.st_atime_ns, new_ns))
+
+    second = hashing.content_hash_with_cache(f, cache)
+    assert second != first
+
+
+def test_hashcache_legacy_entry_is_reused_and_upgraded(tmp_path: Path) -> None:
+    f = tmp_path / "shot.0001.exr"
+    f.write_bytes(b"aaaa")
+    st = f.stat()
+    cache = {f.name: {"size": st.st_size, "mtime": int(st.st_mtime), "hash": "cached"}}
+
+    assert hashing.content_hash_with_cache(f, cache) == "cached"
+    assert cache[f.name]["mtime_ns"] == st.st_mtime_ns
+    assert cache[f.name]["ino"] == st.st_ino
+
+
+def test_set_hash_backend_switches_algorithm(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    p = tmp_path / "clip.mov"
+    p.write_bytes(b"hello")
+    monkeypatch.setattr(hashing, "_HASHER_NEW", hashing._HASHER_NEW)
+    monkeypatch.setattr(hashing, "_PREFIX", hashing._PREFIX)
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+
+    assert hashing.set_hash_backend("sha256") == "sha256"
+    assert hashing.blake3_or_sha256_file(p) == (
+        "sha256:" + hashlib.sha256(b"hello").hexdigest()
+    )
+
+    with pytest.raises(ValueError):
+        hashing.set_hash_backend("md5")
+
+    monkeypatch.setattr(hashing, "blake3", None)
+    with pytest.raises(RuntimeError):
+        hashing.set_hash_backend("blake3")
+    assert hashing.set_hash_backend("auto") == "sha256"
+
+
+def test_manifest_rehashes_only_new_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    frames = []
+    for i in range(1, 6):
+        f = tmp_path / f"shot.{i:04d}.exr"
+        f.write_bytes(bytes([i]) * 8)
+        frames.append(f)
+
+    cache: dict = {}
+    hashing.manifest_hash_for_files(hashing.stat_entries(frames[:3]), cache)
+
+    hashed: list[str] = []
+    real = hashing.blake3_or_sha256_file
+
+    def counting(path: Path, *args, **kwargs) -> str:
+        hashed.append(path.name)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(hashing, "blake3_or_sha256_file", counting)
+    after = hashing.manifest_hash_for_files(hashing.stat_entries(frames), cache)
+
+    assert hashed == ["shot.0004.exr", "shot.0005.exr"]
+    assert after == hashing.manifest_hash_for_files(hashing.stat_entries(frames), {})
+
+
+def test_streamed_multi_chunk_file_matches_single_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    p = tmp_path / "clip.mov"
+    p.write_bytes(bytes(range(256)) * 64)
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1 << 40)
+
+    chunked = hashing.blake3_or_sha256_file(p, chunk=1000)
+
+    assert chunked == hashing.blake3_or_sha256_file(p)
+    assert chunked == hashing._PREFIX + hashing._HASHER_NEW(p.read_bytes()).hexdigest()
+
+
+def test_large_hash_threads_share_idle_cores(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if hashing.blake3 is None:
+        pytest.skip("blake3 not installed")
+
+    seen: list[int] = []
+    real = hashing.blake3.blake3
+
+    def recording(*args, max_threads: int = 1, **kwargs):
+        seen.append(max_threads)
+        return real(*args, max_threads=max_threads, **kwargs)
+
+    p = tmp_path / "clip.mov"
+    p.write_bytes(b"x" * 4096)
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+    monkeypatch.setattr(hashing, "MULTITHREAD_THRESHOLD", 1)
+    monkeypatch.setattr(hashing, "G_HASH_THREADS", 1)
+    monkeypatch.setattr(hashing, "_CPU_COUNT", 8)
+    monkeypatch.setattr(hashing, "G_SHARE_IDLE_CORES", True)
+    monkeypatch.setattr(hashing.blake3, "blake3", recording)
+
+    expected = hashing._PREFIX + real(p.read_bytes()).hexdigest()
+    assert hashing.blake3_or_sha256_file(p) == expected
+
+    # Three other large hashes in flight: an equal share of the 8 cores
+    monkeypatch.setattr(hashing, "_LARGE_ACTIVE", 3)
+    hashing.blake3_or_sha256_file(p)
+
+    monkeypatch.setattr(hashing, "G_SHARE_IDLE_CORES", False)
+    hashing.blake3_or_sha256_file(p)
+
+    assert seen == [8, 2, 1]
+    assert hashing._LARGE_ACTIVE == 3
+
+
+def test_manifest_collects_frame_hashes(tmp_path: Path) -> None:
+    frames = []
+    for i in range(1, 4):
+        f = tmp_path / f"shot.{i:04d}.exr"
+        f.write_bytes(bytes([i]) * 8)
+        frames.append(f)
+
+    cache: dict = {}
+    frame_hashes: dict[str, str] = {}
+    entries = hashing.stat_entries(frames)
+    manifest = hashing.manifest_hash_for_files(entries, cache, frame_hashes)
+
+    assert manifest == hashing.manifest_hash_for_files(entries, {})
+    assert frame_hashes == {name: entry["hash"] for name, entry in cache.items()}
+    assert sorted(frame_hashes) == [f.name for f in frames]
+
+    # Previous hashes are taken before each frame's cache entry is refreshed
+    frames[0].write_bytes(b"changed!")
+    before = dict(frame_hashes)
+    previous: dict[str, str] = {}
+    after: dict[str, str] = {}
+    cache[frames[1].name] = "not-a-dict"
+    del cache[frames[2].name]
+    hashing.manifest_hash_for_files(
+        hashing.stat_entries(frames), cache, after, previous
+    )
+    assert previous == {frames[0].name: before[frames[0].name]}
+    assert after[frames[0].name] != before[frames[0].name]
+    assert after == {name: entry["hash"] for name, entry in cache.items()}
+
+
+def test_manifest_reads_ahead_to_the_next_uncached_frame(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = []
+    for i in range(5):
+        f = tmp_path / f"a.{i:04d}.exr"
+        f.write_bytes(bytes([i]) * 32)
+        files.append(f)
+    entries = hashing.stat_entries(files)
+    cache: dict = {}
+    expected = hashing.manifest_hash_for_files(entries, {})
+
+    # Frame 2 is cached already; the others have to be read
+    hashing.content_hash_with_cache(files[2], cache)
+    hinted: list[Path] = []
+    monkeypatch.setattr(hashing, "_FADV_WILLNEED", 3)
+    monkeypatch.setattr(hashing, "READAHEAD_MIN", 0)
+    monkeypatch.setattr(hashing, "_readahead", lambda path, size: hinted.append(path))
+
+    assert hashing.manifest_hash_for_files(entries, cache) == expected
+    assert hinted == [files[1], files[3], files[4]]
+
+
+def test_manifest_hashes_frames_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = []
+    for i in range(8):
+        f = tmp_path / f"c.{i:04d}.exr"
+        f.write_bytes(bytes([i]) * (64 + i))
+        files.append(f)
+    entries = hashing.stat_entries(files)
+    serial_frames: dict[str, str] = {}
+    expected = hashing.manifest_hash_for_files(entries, {}, serial_frames)
+
+    # Frame 3 is cached already and answered without the pool
+    cache: dict = {}
+    hashing.content_hash_with_cache(files[3], cache)
+    hashed_on: dict[str, str] = {}
+    real_hash = hashing.blake3_or_sha256_file
+
+    def recording_hash(path: Path, size=None) -> str:
+        hashed_on[path.name] = threading.current_thread().name
+        return real_hash(path, size=size)
+
+    monkeypatch.setenv("QC_HASH_WORKERS", "3")
+    monkeypatch.setattr(hashing, "blake3_or_sha256_file", recording_hash)
+    frames: dict[str, str] = {}
+    previous: dict[str, str] = {}
+
+    assert hashing.manifest_hash_for_files(entries, cache, frames, previous) == expected
+    assert list(frames) == [f.name for f in files]
+    assert frames == serial_frames
+    assert previous == {files[3].name: serial_frames[files[3].name]}
+    assert files[3].name not in hashed_on
+    assert len(hashed_on) == 7
+    assert all(t.startswith("qc-frame") for t in hashed_on.values())
+    assert {name: entry["hash"] for name, entry in cache.items()} == serial_frames
+
+
+def test_frame_hash_workers_default_to_hash_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("QC_HASH_WORKERS", raising=False)
+    monkeypatch.setattr(hashing, "G_HASH_THREADS", 4)
+    assert hashing.get_frame_hash_workers() == 4
+
+    monkeypatch.setenv("QC_HASH_WORKERS", "1")
+    assert hashing.get_frame_hash_workers() == 1
+    monkeypatch.setenv("QC_HASH_WORKERS", "lots")
+    assert hashing.get_frame_hash_workers() == 4
+
+
+@pytest.mark.parametrize("backend", ["blake3", "sha256"])
+def test_file_truncated_after_stat_falls_back_to_reading(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    if backend == "blake3" and hashing.blake3 is None:
+        pytest.skip("blake3 not installed")
+    monkeypatch.setattr(hashing, "_HASHER_NEW", hashing._HASHER_NEW)
+    monkeypatch.setattr(hashing, "_PREFIX", hashing._PREFIX)
+    hashing.set_hash_backend(backend)
+
+    p = tmp_path / "clip.mov"
+    p.write_bytes(b"")
+
+    # Stat'ed as a mappable size, but empty by the time it is opened
+    got = hashing.blake3_or_sha256_file(p, size=2 * hashing.MMAP_THRESHOLD)
+
+    assert got == hashing._PREFIX + hashing._HASHER_NEW(b"").hexdigest()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from qc_asset_crawler import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_round_trips_sorted_compact_and_pretty(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    data = {"b": 1, "a": {"z": None, "y": "café"}}
+
+    compact = jsonio.dumps(data)
+    pretty = jsonio.dumps(data, pretty=True)
+
+    assert compact.endswith(b"\n") and pretty.endswith(b"\n")
+    assert b"\n  " not in compact
+    assert b"\n  " in pretty
+    # Keys are sorted in both forms
+    assert compact.index(b'"a"') < compact.index(b'"b"')
+    assert jsonio.loads(compact) == data
+    assert json.loads(pretty.decode("utf-8")) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_raises_value_error_on_invalid_json(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    with pytest.raises(ValueError):
+        jsonio.loads(b"{not json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_line_keeps_order_and_serialises_datetimes(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    from datetime import datetime, timezone
+
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    ts = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+    line = jsonio.dumps_line({"timestamp": ts, "b": "café", "a": 1})
+
+    assert "\n" not in line
+    assert line.index('"b"') < line.index('"a"')
+    assert json.loads(line) == {"timestamp": ts.isoformat(), "b": "café", "a": 1}
+
+
+@pytest.mark.parametrize("size", [0, 10, jsonio.READ_SIZE, jsonio.READ_SIZE * 3 + 7])
+def test_read_and_write_file_round_trip(tmp_path, size: int) -> None:
+    p = tmp_path / "blob.json"
+    data = bytes(i % 251 for i in range(size))
+
+    jsonio.write_file(p, data)
+    assert p.read_bytes() == data
+    assert jsonio.read_file(p) == data
+
+    # Truncates on rewrite
+    jsonio.write_file(p, b"{}")
+    assert jsonio.read_file(p) == b"{}"
+
+
+def test_write_file_fsync_is_opt_in_and_best_effort(tmp_path, monkeypatch) -> None:
+    synced = []
+    monkeypatch.setattr(jsonio.os, "fsync", lambda fd: synced.append(fd))
+    jsonio.write_file(tmp_path / "a.json", b"{}")
+    assert synced == []
+    jsonio.write_file(tmp_path / "a.json", b"{}", fsync=True)
+    assert len(synced) == 1
+
+    def unsupported(fd):
+        raise OSError("fsync not supported")
+
+    monkeypatch.setattr(jsonio.os, "fsync", unsupported)
+    jsonio.write_file(tmp_path / "a.json", b"[]", fsync=True)
+    assert jsonio.read_file(tmp_path / "a.json") == b"[]"
+
+
+def test_read_file_missing_raises_file_not_found(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        jsonio.read_file(tmp_path / "missing.json")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_integers_wider_than_64_bits_round_trip_exactly(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+
+    big = 123456789012345678901
+    data = {"frame_min": big, "a": 1}
+
+    compact = jsonio.dumps(data)
+    assert compact == b'{"a":1,"frame_min":123456789012345678901}\n'
+    assert json.loads(jsonio.dumps(data, pretty=True)) == data
+    assert jsonio.dumps_line(data) == '{"frame_min":123456789012345678901,"a":1}'
+
+    # Read back exactly, not as a float, from bytes and str alike
+    for raw in (compact, compact.decode("utf-8")):
+        loaded = jsonio.loads(raw)
+        assert loaded == data
+        assert type(loaded["frame_min"]) is int
+    assert jsonio.loads(b"-9223372036854775809") == -9223372036854775809
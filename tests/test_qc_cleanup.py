@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import qc_cleanup
+
+
+def _make_tree(root: Path) -> dict[str, Path]:
+    shot = root / "shot"
+    (shot / ".qc" / "nested").mkdir(parents=True)
+    paths = {
+        "frame": shot / "shot.0001.exr",
+        "inline": shot / "clip.mov.qc.json",
+        "dot": shot / ".clip.mov.qc.json",
+        "sequence": shot / qc_cleanup.SEQ_NAME,
+        "sequence_dot": shot / qc_cleanup.SEQ_DOT_NAME,
+        "hashcache": shot / qc_cleanup.HASHCACHE_NAME,
+        "subdir": shot / ".qc" / "clip.mov.qc.json",
+        "nested": shot / ".qc" / "nested" / "leftover.txt",
+        "other": shot / "notes.txt",
+    }
+    for p in paths.values():
+        p.write_text("x", encoding="utf-8")
+    return paths
+
+
+def test_cleanup_removes_artifacts_and_keeps_media(tmp_path: Path) -> None:
+    paths = _make_tree(tmp_path)
+
+    removed = qc_cleanup.cleanup(tmp_path)
+
+    # 5 sidecar/cache files + the whole .qc folder (including nested dirs)
+    assert removed == 6
+    assert not (tmp_path / "shot" / ".qc").exists()
+    for key in ("inline", "dot", "sequence", "sequence_dot", "hashcache"):
+        assert not paths[key].exists(), key
+    assert paths["frame"].exists()
+    assert paths["other"].exists()
+
+
+def test_cleanup_dry_run_removes_nothing(tmp_path: Path) -> None:
+    paths = _make_tree(tmp_path)
+
+    assert qc_cleanup.cleanup(tmp_path, dry_run=True) == 0
+    assert all(p.exists() for p in paths.values())
@@ -1,4 +1,6 @@
+import json
 import logging
+from datetime import datetime, timezone
 
 import qc_crawl
 
@@ -39,6 +41,22 @@ def test_ignore_empty_message_filter_filters_empty_and_whitespace():
     assert flt.filter(normal) is True
 
 
+def test_ignore_empty_message_filter_renders_args_once():
+    flt = qc_crawl.IgnoreEmptyMessageFilter()
+
+    blank = logging.LogRecord("test", logging.INFO, __file__, 0, "%s", ("  ",), None)
+    filled = logging.LogRecord(
+        "test", logging.INFO, __file__, 0, "found %s", ("a.exr",), None
+    )
+
+    assert flt.filter(blank) is False
+    assert flt.filter(filled) is True
+    # Rendered once; the formatter sees the final text with no args left
+    assert filled.msg == "found a.exr"
+    assert filled.args is None
+    assert filled.getMessage() == "found a.exr"
+
+
 def test_configure_logging_quiet_raises_effective_level():
     # Start from a clean config
     qc_crawl.configure_logging(level_name="DEBUG", quiet=True, json_logs=False)
@@ -47,6 +65,31 @@ def test_configure_logging_quiet_raises_effective_level():
     assert root.level >= logging.WARNING
 
 
+def test_configure_logging_maps_level_names():
+    root = logging.getLogger()
+
+    qc_crawl.configure_logging(level_name="debug")
+    assert root.level == logging.DEBUG
+    qc_crawl.configure_logging(level_name="warn")
+    assert root.level == logging.WARNING
+    # Not a level, even though logging has an attribute by that name
+    qc_crawl.configure_logging(level_name="basic_format")
+    assert root.level == logging.INFO
+
+
+def test_configure_logging_reuses_handler_for_same_settings():
+    qc_crawl.configure_logging(level_name="INFO", quiet=False, json_logs=True)
+    root = logging.getLogger()
+    first = list(root.handlers)
+
+    qc_crawl.configure_logging(level_name="info", quiet=False, json_logs=True)
+    assert root.handlers == first
+
+    qc_crawl.configure_logging(level_name="INFO", quiet=False, json_logs=False)
+    assert root.handlers != first
+    assert len(root.handlers) == 1
+
+
 def test_configure_logging_uses_json_formatter_when_requested():
     qc_crawl.configure_logging(level_name="INFO", quiet=False, json_logs=True)
     root = logging.getLogger()
@@ -69,3 +112,45 @@ def test_configure_logging_attaches_ignore_empty_message_filter():
         any(isinstance(f, qc_crawl.IgnoreEmptyMessageFilter) for f in h.filters)
         for h in root.handlers
     )
+
+
+def test_json_formatter_emits_one_json_object_per_record():
+    record = logging.LogRecord(
+        name="qc",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=0,
+        msg="hashed %s",
+        args=("shot.0001.exr",),
+        exc_info=None,
+    )
+
+    line = qc_crawl.JsonFormatter().format(record)
+    payload = json.loads(line)
+
+    assert payload["message"] == "hashed shot.0001.exr"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "qc"
+    assert payload["timestamp"] == (
+        datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
+    )
+
+
+def test_colour_formatter_wraps_known_levels_only():
+    fmt = qc_crawl.ColourFormatter(fmt="%(levelname)s %(message)s")
+
+    warn = logging.LogRecord("t", logging.WARNING, __file__, 0, "hi", (), None)
+    custom = logging.LogRecord("t", 25, __file__, 0, "hi", (), None)
+
+    assert fmt.format(warn) == "\033[93mWARNING hi\033[0m"
+    assert fmt.format(custom) == "Level 25 hi"
+
+
+def test_colour_formatter_time_cache_tracks_the_second():
+    fmt = qc_crawl.ColourFormatter(fmt="%(asctime)s", datefmt="%H:%M:%S")
+    plain = logging.Formatter(fmt="%(asctime)s", datefmt="%H:%M:%S")
+
+    for created in (1000.1, 1000.9, 1001.0, 1001.5, 3601.2):
+        record = logging.LogRecord("t", 25, __file__, 0, "x", (), None)
+        record.created = created
+        assert fmt.format(record) == plain.format(record)
@@ -121,6 +121,33 @@ def test_removed_frames_counted_when_enabled():
     assert result.removed_frames == ["0002"]
 
 
+def test_identical_hashes_are_not_mutated():
+    config = SequenceMutationConfig(threshold_frames=1)
+
+    prev = {"0001": "a", "0002": "b"}
+    result = detect_sequence_mutation(prev, dict(prev), config)
+
+    assert result.mutated is False
+    assert result.total_changes == 0
+    assert result.total_before == result.total_after == 2
+
+
+def test_accepts_read_only_mappings_without_copying():
+    from types import MappingProxyType
+
+    config = SequenceMutationConfig(threshold_frames=1)
+
+    prev = MappingProxyType({"0001": "a", "0002": "b", "0003": "c"})
+    curr = MappingProxyType({"0001": "a", "0002": "X", "0004": "d"})
+
+    result = detect_sequence_mutation(prev, curr, config)
+
+    assert result.changed_frames == ["0002"]
+    assert result.added_frames == ["0004"]
+    assert result.removed_frames == ["0003"]
+    assert result.mutated is True
+
+
 def test_summarize_frame_spans_basic_ranges():
     frames = ["0001", "0002", "0003", "0005", "0007", "0008"]
     summary = summarize_frame_spans(frames)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from qc_asset_crawler import sequences
 
 
@@ -173,3 +175,150 @@ def test_group_sequences_and_summarize_integration(make_fake_sequence_tree) -> N
     assert info["range_count"] == 2
     # Padding from filenames, e.g. "1001" -> 4 digits
     assert info["pad"] == 4
+
+
+def test_iter_media_skips_hidden_and_non_media(tmp_path: Path) -> None:
+    (tmp_path / "shot" / "sub").mkdir(parents=True)
+    (tmp_path / ".qc").mkdir()
+    (tmp_path / "shot" / "a.0001.EXR").write_text("x", encoding="utf-8")
+    (tmp_path / "shot" / "sub" / "clip.mov").write_text("x", encoding="utf-8")
+    (tmp_path / "shot" / "notes.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "shot" / ".hidden.mov").write_text("x", encoding="utf-8")
+    (tmp_path / ".qc" / "clip.mov").write_text("x", encoding="utf-8")
+
+    found = sorted(sequences.iter_media(tmp_path))
+
+    assert found == [
+        tmp_path / "shot" / "a.0001.EXR",
+        tmp_path / "shot" / "sub" / "clip.mov",
+    ]
+
+
+def test_iter_media_concurrent_walk_matches_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for shot in range(6):
+        for sub in ("plates", "renders/v001", "renders/v002"):
+            d = tmp_path / f"sh{shot:03d}" / sub
+            d.mkdir(parents=True)
+            for frame in range(3):
+                (d / f"f.{frame:04d}.exr").write_bytes(b"x")
+    (tmp_path / "sh000" / "notes.txt").write_text("x", encoding="utf-8")
+
+    monkeypatch.setenv("QC_WALK_CONCURRENCY", "1")
+    serial = list(sequences.iter_media(tmp_path))
+    monkeypatch.setenv("QC_WALK_CONCURRENCY", "4")
+    concurrent = list(sequences.iter_media(tmp_path))
+
+    assert len(serial) == 6 * 3 * 3
+    assert sorted(concurrent) == sorted(serial)
+    # Concurrent order is deterministic run to run
+    assert list(sequences.iter_media(tmp_path)) == concurrent
+
+
+def test_iter_media_does_not_follow_symlinked_dirs(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "clip.mov").write_text("x", encoding="utf-8")
+    walk = tmp_path / "walk"
+    walk.mkdir()
+    try:
+        (walk / "linked").symlink_to(real, target_is_directory=True)
+        (walk / "odd.mov").symlink_to(real, target_is_directory=True)
+        (walk / "file.mov").symlink_to(real / "clip.mov")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    found = sorted(sequences.iter_media(walk))
+
+    # Linked directories (even media-named ones) are skipped; linked files
+    # are still reported.
+    assert found == [walk / "file.mov"]
+
+
+def test_parse_frame_name_matches_legacy_pattern() -> None:
+    """parse_frame_name must agree with the regex it replaced."""
+    import re
+
+    legacy = re.compile(r"^(?P<base>.*?)(?P<frame>\d+)(?P<dot>\.)(?P<ext>[^.]+)$")
+    names = [
+        "shotA.0001.exr",
+        "0001.dpx",
+        "shot_v02_0100.tif",
+        "conjuring-last-rites_tlr-f1_dcin_las.087469.tif",
+        "a.b.0012.png",
+        "no_frame.exr",
+        "trailingdot0001.",
+        ".0001",
+        "plain",
+        "12.34.56",
+    ]
+    for name in names:
+        m = legacy.match(name)
+        expected = (m.group("base"), m.group("frame"), m.group("ext")) if m else None
+        assert sequences.parse_frame_name(name) == expected, name
+
+
+def test_group_sequences_accepts_iterator(make_fake_sequence_tree) -> None:
+    root, frames = make_fake_sequence_tree(base="iter_seq", ext="exr", count=4)
+    short = [root / "other.0001.exr", root / "other.0002.exr"]
+    single = root / "clip.mov"
+
+    seq_map, singles = sequences.group_sequences(
+        iter(frames + short + [single]), min_seq=3
+    )
+
+    assert list(seq_map.values()) == [sorted(frames)]
+    assert sorted(singles) == sorted(short + [single])
+
+
+def test_group_sequences_orders_members_like_sorted_paths(tmp_path: Path) -> None:
+    # Unpadded frame numbers: lexicographic, not numeric, as before
+    frames = [tmp_path / f"plate.{i}.exr" for i in (1000, 999, 10, 1001, 9)]
+
+    seq_map, _singles = sequences.group_sequences(reversed(frames), min_seq=3)
+
+    assert list(seq_map.values()) == [sorted(frames)]
+
+
+def test_numpy_range_scan_matches_pure_python(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("numpy")
+
+    frames = sorted(
+        list(range(1, 400)) + list(range(450, 900, 3)) + [1000, 1000, 2**40]
+    )
+
+    monkeypatch.setattr(sequences, "NUMPY_MIN_FRAMES", 1)
+    vectorised = sequences._count_ranges_and_holes(frames)
+    monkeypatch.setattr(sequences, "np", None)
+    pure = sequences._count_ranges_and_holes(frames)
+
+    assert vectorised == pure
+
+
+def test_numpy_is_not_imported_for_short_sequences() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from qc_asset_crawler import crawler, sequences\n"
+        "sequences.summarize_frames(['a.0001.exr', 'a.0003.exr'])\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_group_sequences_keys_match_path_parent() -> None:
+    files = [Path(f"a.{i:04d}.exr") for i in range(3)]
+    files += [Path("shot") / f"b.{i:04d}.dpx" for i in range(3)]
+
+    seq_map, singles = sequences.group_sequences(files, min_seq=3)
+
+    assert singles == []
+    assert set(seq_map) == {(Path("."), "a.", "exr"), (Path("shot"), "b.", "dpx")}
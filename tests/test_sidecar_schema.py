@@ -1,6 +1,7 @@
 import pytest
 import json
 
+from qc_asset_crawler import sidecar
 from qc_asset_crawler.sidecar import (
     read_sidecar,
     write_sidecar,
@@ -42,6 +43,15 @@ def test_validate_v1_sidecar_missing_required_field_raises():
     assert "asset_path" in str(excinfo.value)
 
 
+def test_validate_v1_sidecar_strict_reports_extra_fields(caplog):
+    data = make_minimal_v1_sidecar(zeta=1, alpha=2, notes="ok")
+
+    with caplog.at_level("WARNING"):
+        validate_v1_sidecar(data, strict=True)
+
+    assert "unexpected extra fields: alpha, zeta" in caplog.text
+
+
 @pytest.mark.parametrize(
     "input_value, expected",
     [
@@ -175,6 +185,37 @@ def test_write_and_read_sidecar_roundtrip(tmp_path, monkeypatch):
     assert int(loaded["schema_version"]) == int(get_schema_version())
 
 
+def test_write_sidecar_recreates_removed_parent(tmp_path):
+    import shutil
+
+    qc_dir = tmp_path / ".qc"
+    write_sidecar(qc_dir / "a.qc.json", make_minimal_v1_sidecar())
+
+    # Parent is now cached as existing; removing it must not break writes.
+    shutil.rmtree(qc_dir)
+    write_sidecar(qc_dir / "b.qc.json", make_minimal_v1_sidecar())
+
+    assert read_sidecar(qc_dir / "b.qc.json")["asset_hash"] == "abc123"
+
+
+def test_write_sidecar_skips_identical_content(tmp_path, monkeypatch):
+    p = tmp_path / "a.qc.json"
+    write_sidecar(p, make_minimal_v1_sidecar())
+
+    replaced: list = []
+    real_replace = sidecar.os.replace
+    monkeypatch.setattr(
+        sidecar.os, "replace", lambda *a: (replaced.append(a), real_replace(*a))
+    )
+
+    write_sidecar(p, make_minimal_v1_sidecar())
+    assert replaced == []
+
+    write_sidecar(p, make_minimal_v1_sidecar(asset_hash="def456"))
+    assert len(replaced) == 1
+    assert read_sidecar(p)["asset_hash"] == "def456"
+
+
 def test_read_sidecar_adds_schema_metadata_for_legacy_file(tmp_path, monkeypatch):
     """
     Simulate a legacy sidecar that was written before we had schema_name/version.
@@ -200,3 +241,51 @@ def test_read_sidecar_adds_schema_metadata_for_legacy_file(tmp_path, monkeypatch
     # Metadata has been injected
     assert loaded["schema_name"] == "legacy.schema"
     assert int(loaded["schema_version"]) == int(get_schema_version())
+
+
+def test_naming_and_policy_getters_read_environment_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    getters = (
+        sidecar.get_side_suffix_file,
+        sidecar.get_side_name_sequence,
+        sidecar.get_qc_policy_version,
+    )
+    monkeypatch.setenv("QC_POLICY_VERSION", "2099.1.0")
+    for getter in getters:
+        getter.cache_clear()
+    try:
+        assert sidecar.get_qc_policy_version() == "2099.1.0"
+
+        # Cached until explicitly cleared
+        monkeypatch.setenv("QC_POLICY_VERSION", "2099.2.0")
+        assert sidecar.get_qc_policy_version() == "2099.1.0"
+        sidecar.get_qc_policy_version.cache_clear()
+        assert sidecar.get_qc_policy_version() == "2099.2.0"
+    finally:
+        for getter in getters:
+            getter.cache_clear()
+
+
+def test_set_hidden_attribute_calls_chflags_in_process(tmp_path, monkeypatch):
+    import stat
+    import subprocess
+
+    path = tmp_path / ".clip.mov.qc.json"
+    path.write_text("{}", encoding="utf-8")
+    calls = []
+
+    monkeypatch.setattr(sidecar, "G_SIDECAR_MODE", "dot", raising=False)
+    monkeypatch.setattr(sidecar.sys, "platform", "darwin")
+    monkeypatch.setattr(
+        sidecar.os, "chflags", lambda p, f: calls.append((p, f)), raising=False
+    )
+    monkeypatch.setattr(
+        subprocess, "run", lambda *a, **k: pytest.fail("spawned chflags(1)")
+    )
+
+    sidecar.set_hidden_attribute(path)
+
+    assert len(calls) == 1
+    assert calls[0][0] == path
+    assert calls[0][1] & stat.UF_HIDDEN
@@ -101,6 +101,23 @@ def test_find_sidecars_from_dir_and_file(tmp_path: Path) -> None:
     assert set(result) == {inline, sub_sidecar}
 
 
+def test_find_sidecars_walk_matches_rglob(tmp_path: Path) -> None:
+    for rel in (
+        "a.mov.qc.json",
+        "shot/.b.mov.qc.json",
+        "shot/sequence.qc.json",
+        "shot/deep/.qc/c.exr.qc.json",
+        "shot/deep/.sequence.qc.json",
+        "shot/notes.json",
+        "shot/c.exr",
+    ):
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("{}", encoding="utf-8")
+
+    assert summary.find_sidecars([str(tmp_path)]) == sorted(tmp_path.rglob("*.qc.json"))
+
+
 def test_main_default_mode_with_rollup(
     tmp_path: Path,
     make_sidecar,
@@ -212,3 +229,20 @@ def test_find_sidecars_warns_on_non_sidecar_file(
     captured = capsys.readouterr()
     assert "File does not look like a sidecar" in captured.err
     assert str(non_sidecar) in captured.err
+
+
+def test_load_json_reports_unreadable_and_invalid_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    good = tmp_path / "good.qc.json"
+    good.write_text('{"qc_result": "pass", "notes": "café"}', encoding="utf-8")
+    bad = tmp_path / "bad.qc.json"
+    bad.write_bytes(b"{not json")
+
+    assert summary.load_json(good) == {"qc_result": "pass", "notes": "café"}
+    assert summary.load_json(bad) is None
+    assert summary.load_json(tmp_path / "missing.qc.json") is None
+
+    err = capsys.readouterr().err
+    assert "Failed to parse JSON" in err
+    assert "Failed to read" in err
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from pathlib import Path
+
+import pytest
+
+from qc_asset_crawler import trak_client
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict | None = None) -> None:
+        self.status_code = status_code
+        self.ok = 200 <= status_code < 300
+        self._data = data or {}
+        self.text = ""
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeSession:
+    def __init__(self, post) -> None:
+        self.post = post
+
+
+@pytest.fixture
+def trak_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TRAK_BASE_URL", "http://trak.test/api")
+    monkeypatch.delenv("TRAK_ASSET_TRACKER_API_KEY", raising=False)
+    monkeypatch.delenv("TRAK_BATCH_LOOKUP", raising=False)
+    trak_client.clear_lookup_cache()
+
+
+@pytest.fixture
+def install_post(monkeypatch: pytest.MonkeyPatch):
+    """Install a fake session whose .post is the given function."""
+
+    def _install(post) -> None:
+        monkeypatch.setattr(trak_client, "_session", lambda: FakeSession(post))
+
+    return _install
+
+
+def test_batched_lookup_matches_items_by_asset_path(trak_env, install_post) -> None:
+    calls: list[dict] = []
+
+    def fake_post(url, json, timeout):
+        calls.append(json)
+        return FakeResponse(
+            200,
+            {
+                "items": [
+                    {"assetPath": "/show/b.mov", "asset_id": "B"},
+                    {"assetPath": "/show/a.mov", "asset_id": "A"},
+                ]
+            },
+        )
+
+    install_post(fake_post)
+
+    paths = [Path("/show/a.mov"), Path("/show/b.mov"), Path("/show/c.mov")]
+    results = trak_client.tracker_lookup_assets_by_paths(paths)
+
+    assert len(calls) == 1
+    assert calls[0]["assetPaths"] == ["/show/a.mov", "/show/b.mov", "/show/c.mov"]
+    assert results[paths[0]]["asset_id"] == "A"
+    assert results[paths[1]]["asset_id"] == "B"
+    assert results[paths[2]] == {"asset_id": None, "status": "ok", "http_code": 200}
+
+
+def test_batcher_coalesces_concurrent_lookups(trak_env, install_post) -> None:
+    batches: list[list[str]] = []
+
+    def fake_post(url, json, timeout):
+        batches.append(json["assetPaths"])
+        items = [{"assetPath": p, "asset_id": f"ID-{p}"} for p in json["assetPaths"]]
+        return FakeResponse(200, {"items": items})
+
+    install_post(fake_post)
+
+    batcher = trak_client.TrackerBatcher(batch_size=100, linger=0.2)
+    paths = [Path(f"/show/clip{i}.mov") for i in range(8)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(batcher.lookup, paths))
+
+    assert [r["asset_id"] for r in results] == [f"ID-{p.as_posix()}" for p in paths]
+    assert sum(len(b) for b in batches) == len(paths)
+    assert len(batches) < len(paths)
+
+
+def test_batcher_falls_back_to_single_lookups(trak_env, install_post) -> None:
+    def fake_post(url, json, timeout):
+        if "assetPaths" in json:
+            return FakeResponse(400)
+        return FakeResponse(200, {"items": [{"asset_id": "SINGLE"}]})
+
+    install_post(fake_post)
+
+    batcher = trak_client.TrackerBatcher(linger=0)
+
+    assert batcher.lookup(Path("/show/a.mov"))["asset_id"] == "SINGLE"
+    assert batcher._batch_supported is False
+    assert batcher.lookup(Path("/show/b.mov"))["asset_id"] == "SINGLE"
+
+
+def test_lookup_uses_single_request_unless_batching_enabled(
+    trak_env, install_post
+) -> None:
+    bodies: list[dict] = []
+
+    def fake_post(url, json, timeout):
+        bodies.append(json)
+        return FakeResponse(200, {"items": [{"asset_id": "X"}]})
+
+    install_post(fake_post)
+
+    result = trak_client.tracker_lookup_asset_by_path(Path("/show/a.mov"))
+
+    assert result == {"asset_id": "X", "status": "ok", "http_code": 200}
+    assert bodies[0]["assetPath"] == "/show/a.mov"
+
+
+def test_session_is_reused_and_carries_default_headers(
+    trak_env, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRAK_ASSET_TRACKER_API_KEY", "secret")
+    trak_client.reset_session()
+    try:
+        s1 = trak_client._session()
+        s2 = trak_client._session()
+        assert s1 is s2
+        assert s1.headers["x-api-key"] == "secret"
+        assert s1.headers["content-type"] == "application/json"
+    finally:
+        trak_client.reset_session()
+
+
+def test_session_pool_grows_to_worker_count(
+    trak_env, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(trak_client, "G_WORKERS", trak_client.POOL_MAXSIZE * 2)
+    trak_client.reset_session()
+    try:
+        adapter = trak_client._session().get_adapter("https://trak.test/")
+        assert adapter._pool_maxsize == trak_client.POOL_MAXSIZE * 2
+    finally:
+        trak_client.reset_session()
+
+
+def test_qc_posts_run_in_background_until_stopped(
+    trak_env, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    release = threading.Event()
+    posted: list[str] = []
+
+    def slow_set_qc(asset_id, payload) -> bool:
+        release.wait(5)
+        posted.append(asset_id)
+        return True
+
+    monkeypatch.setattr(trak_client, "tracker_set_qc", slow_set_qc)
+
+    trak_client.start_qc_poster(threads=2)
+    try:
+        # Returns straight away; the post is still waiting on the "network"
+        trak_client.post_qc("ASSET-1", {"qc_result": "pass"})
+        trak_client.post_qc("ASSET-2", {"qc_result": "pass"})
+        assert posted == []
+        release.set()
+    finally:
+        trak_client.stop_qc_poster()
+
+    assert sorted(posted) == ["ASSET-1", "ASSET-2"]
+
+    # With no poster running, posts go out inline
+    trak_client.post_qc("ASSET-3", {"qc_result": "pass"})
+    assert posted[-1] == "ASSET-3"
+
+
+def test_successful_lookups_are_remembered(trak_env, install_post) -> None:
+    bodies: list[dict] = []
+    status = {"code": 503}
+
+    def fake_post(url, json, timeout):
+        bodies.append(json)
+        return FakeResponse(status["code"], {"items": [{"asset_id": "X"}]})
+
+    install_post(fake_post)
+    shot = Path("/show/shot010")
+
+    # Failures are retried...
+    assert trak_client.tracker_lookup_asset_by_path(shot)["status"] == "error"
+    status["code"] = 200
+    assert trak_client.tracker_lookup_asset_by_path(shot)["asset_id"] == "X"
+    assert len(bodies) == 2
+
+    # ...answers are not
+    assert trak_client.tracker_lookup_asset_by_path(shot)["asset_id"] == "X"
+    assert len(bodies) == 2
+
+    trak_client.clear_lookup_cache()
+    trak_client.tracker_lookup_asset_by_path(shot)
+    assert len(bodies) == 3
+
+
+def test_concurrent_lookups_of_one_path_share_a_request(trak_env, install_post) -> None:
+    bodies: list[dict] = []
+    release = threading.Event()
+
+    def fake_post(url, json, timeout):
+        bodies.append(json)
+        assert release.wait(5)
+        return FakeResponse(200, {"items": [{"asset_id": "X"}]})
+
+    install_post(fake_post)
+    shot = Path("/show/shot010")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+        futs = [
+            ex.submit(trak_client.tracker_lookup_asset_by_path, shot) for _ in range(4)
+        ]
+        release.set()
+        results = [f.result() for f in futs]
+
+    assert [r["asset_id"] for r in results] == ["X"] * 4
+    assert len(bodies) == 1